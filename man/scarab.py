@@ -185,6 +185,18 @@ docstring_md(
     s_function = 'mcds.is_in_mesh',
     ls_doc = pcdl.TimeStep.is_in_mesh.__doc__.split('\n'),
 )
+docstring_md(
+    s_function = 'mcds.is_in_mesh_batch',
+    ls_doc = pcdl.TimeStep.is_in_mesh_batch.__doc__.split('\n'),
+)
+docstring_md(
+    s_function = 'mcds.get_mesh_mnp',
+    ls_doc = pcdl.TimeStep.get_mesh_mnp.__doc__.split('\n'),
+)
+docstring_md(
+    s_function = 'mcds.get_mesh_mnp_batch',
+    ls_doc = pcdl.TimeStep.get_mesh_mnp_batch.__doc__.split('\n'),
+)
 # voxel
 docstring_md(
     s_function = 'mcds.get_voxel_volume',
@@ -198,6 +210,10 @@ docstring_md(
     s_function = 'mcds.get_voxel_ijk',
     ls_doc = pcdl.TimeStep.get_voxel_ijk.__doc__.split('\n'),
 )
+docstring_md(
+    s_function = 'mcds.get_voxel_ijk_batch',
+    ls_doc = pcdl.TimeStep.get_voxel_ijk_batch.__doc__.split('\n'),
+)
 
 # write pyMCDS microenv function markdown files
 docstring_md(
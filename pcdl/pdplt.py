@@ -61,12 +61,11 @@ def df_label_to_color(df_abc, s_focus, es_label=None, s_nolabel='gray', s_cmap='
        ls_label = sorted(es_label)
     a_color = plt.get_cmap(s_cmap)(np.linspace(0, 1, len(ls_label)))
     do_color = dict(zip(ls_label, a_color))
-    df_abc[f'{s_focus}_color'] = s_nolabel
     ds_color = {}
     for s_category, o_color in do_color.items():
         s_color = colors.to_hex(o_color)
         ds_color.update({s_category : s_color})
-        df_abc.loc[(df_abc.loc[:,s_focus] == s_category), f'{s_focus}_color'] = s_color
+    df_abc[f'{s_focus}_color'] = df_abc.loc[:,s_focus].astype(object).map(ds_color).fillna(s_nolabel).to_numpy()
     # output
     return(ds_color)
 
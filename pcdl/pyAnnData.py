@@ -27,7 +27,6 @@ import pandas as pd
 from pcdl.pyMCDS import pyMCDS, es_coor_cell
 from pcdl.pyMCDSts import pyMCDSts
 from scipy import sparse
-import warnings
 
 def scaler(df_x, scale='maxabs'):
     """
@@ -88,27 +87,35 @@ def scaler(df_x, scale='maxabs'):
     # -1,1
     elif scale == 'maxabs':
         a_x = df_x.values
-        warnings.filterwarnings('ignore', category=RuntimeWarning)
-        a_maxabs = a_x / abs(a_x).max(axis=0)
-        warnings.simplefilter('default')
-        a_maxabs[np.isnan(a_maxabs)] = 0  # fix if entier column is 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            a_maxabs = np.zeros(a_x.shape, dtype=np.float64)  # entier column is 0 stays 0
+            ar_maxabs = np.maximum(a_x.max(axis=0), -a_x.min(axis=0))
+            np.divide(a_x, ar_maxabs, out=a_maxabs, where=(ar_maxabs != 0))
+        a_maxabs[np.isnan(a_maxabs)] = 0  # fix nan values
         df_x = pd.DataFrame(a_maxabs, columns=df_x.columns, index=df_x.index)
     # 0,1
     elif scale == 'minmax':
         a_x = df_x.values
-        warnings.simplefilter("ignore")
-        warnings.filterwarnings('ignore', category=RuntimeWarning)
-        a_minmax = (a_x - a_x.min(axis=0)) / (a_x.max(axis=0) - a_x.min(axis=0))
-        warnings.simplefilter('default')
-        a_minmax[np.isnan(a_minmax)] = 0  # fix if entier column has same value
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ar_min = a_x.min(axis=0)
+            ar_range = a_x.max(axis=0) - ar_min
+            a_minmax = np.subtract(a_x, ar_min, dtype=np.float64)
+            np.divide(a_minmax, ar_range, out=a_minmax, where=(ar_range != 0))
+        a_minmax[:, ar_range == 0] = 0  # fix if entier column has same value
+        a_minmax[np.isnan(a_minmax)] = 0  # fix nan values
         df_x = pd.DataFrame(a_minmax, columns=df_x.columns, index=df_x.index)
     # sigma
     elif scale == 'std':
         a_x = df_x.values
-        warnings.filterwarnings('ignore', category=RuntimeWarning)
-        a_std = (a_x - a_x.mean(axis=0)) / a_x.std(axis=0, ddof=1)
-        warnings.simplefilter('default')
-        a_std[np.isnan(a_std)] = 0  # fix if entier column has same value
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if (a_x.shape[0] > 1):
+                ar_std = a_x.std(axis=0, ddof=1)
+            else:
+                ar_std = np.zeros(a_x.shape[1], dtype=np.float64)  # single sample has no ddof=1 std
+            a_std = np.subtract(a_x, a_x.mean(axis=0), dtype=np.float64)
+            np.divide(a_std, ar_std, out=a_std, where=(ar_std != 0))
+        a_std[:, ar_std == 0] = 0  # fix if entier column has same value
+        a_std[np.isnan(a_std)] = 0  # fix nan values
         df_x = pd.DataFrame(a_std, columns=df_x.columns, index=df_x.index)
     else:
         raise ValueError(f"Error @ scaler : unknown scale algorithm {scale} detected. known are [None, 'maxabs', 'minmax', 'std'].")
@@ -116,7 +123,7 @@ def scaler(df_x, scale='maxabs'):
     return df_x
 
 
-def _anndextract(df_cell, scale='maxabs', graph_attached={}, graph_neighbor={}, graph_method='PhysiCell'):
+def _anndextract(df_cell, scale='maxabs', graph_attached={}, graph_neighbor={}, graph_method='PhysiCell', return_anndata=False):
     """
     input:
         df_cell:  pandas dataframe
@@ -138,9 +145,14 @@ def _anndextract(df_cell, scale='maxabs', graph_attached={}, graph_neighbor={},
         graph_method: string; default PhysiCell
             method how the graph was generated.
 
+        return_anndata: boolean; default False
+            if True, the extracted data is directly packed
+            into an anndata object, with a float32 numpy array as X.
+
     output:
         df_count, df_obs, d_obsm, d_obsp, d_uns dataframes and dictionaries,
             ready to be backed into an anndata object.
+            or, if return_anndata is True, the anndata object itself.
 
     description:
         this function takes a pcdl df_cell pandas dataframe and re-formats
@@ -149,20 +161,24 @@ def _anndextract(df_cell, scale='maxabs', graph_attached={}, graph_neighbor={},
         and one dictionary of string (d_uns),
         which downstream might be transformed into an anndata object.
     """
-    # transform index to string
-    df_coor = df_cell.loc[:,['position_x','position_y','position_z']].copy()
+    # transform index to string, on a shallow copy, so that the input df_cell stays untouched
+    df_cell = df_cell.copy(deep=False)
+    ar_coor = df_cell.loc[:,['position_x','position_y','position_z']].to_numpy(copy=True)
+    ai_id = df_cell.index.to_numpy(dtype=np.int64)
     df_cell.index = df_cell.index.astype(str)
 
     # build obs anndata object (annotation of observations)
-    df_obs = df_cell.loc[:,['mesh_center_p','time']].copy()
-    df_obs.columns = ['z_layer', 'time']
+    df_obs = pd.DataFrame(
+        df_cell.loc[:,['mesh_center_p','time']].to_numpy(copy=True),
+        columns = ['z_layer', 'time'],
+        index = df_cell.index,
+    )
 
     # buil obsm anndata object spatial (multi-dimensional annotation of observations)
-    if (len(set(df_cell.position_z)) == 1):
-        df_obsm = df_cell.loc[:,['position_x','position_y']].copy()
+    if (ar_coor.shape[0] > 0) and (ar_coor[:,2] == ar_coor[0,2]).all():
+        d_obsm = {"spatial": ar_coor[:,0:2].copy()}
     else:
-        df_obsm = df_cell.loc[:,['position_x','position_y','position_z']].copy()
-    d_obsm = {"spatial": df_obsm.values}
+        d_obsm = {"spatial": ar_coor.copy()}
 
     # build obsp and uns anndata object graph (pairwise annotation of obeservation) and (unstructured data)
     ####
@@ -171,54 +187,83 @@ def _anndextract(df_cell, scale='maxabs', graph_attached={}, graph_neighbor={},
     #   from Alexis Coullomb form the Pancaldi Lab.
     #   https://github.com/VeraPancaldiLab/tysserand/blob/main/tysserand/tysserand.py#L1546
     ####
-    # extract cell_id to index mapping (i always loved perl)
-    di_ididx = df_cell.reset_index().loc[:,'ID'].reset_index().astype(int).set_index('ID').squeeze().to_dict()
     # transform cell id graph dict to index matrix and pack for anndata
     d_obsp = {}  # pairwise annotation of obeservation
     d_uns = {}  # unstructured data
-    for s_graph, dei_graph in [('neighbor', graph_neighbor), ('attached', graph_attached)]:
-        lli_edge = []
-        lr_distance = []
-        for i_src, ei_dst in dei_graph.items():
-            for i_dst in ei_dst:
-                # extract edge
-                lli_edge.append([di_ididx[i_src], di_ididx[i_dst]])
-                r_distance = ((df_coor.loc[i_src,:].values -  df_coor.loc[i_dst,:].values)**2).sum()**(1/2)
-                lr_distance.append(r_distance)
-        # if there is a graph
-        if (len(lli_edge) > 0):
-            # handle edge data
-            ai_edge = np.array(lli_edge, dtype=np.uint)
-            # handle connection data
-            ai_conectivity = np.ones(ai_edge.shape[0], dtype=np.uint16)
-            ai_conectivity_sparse = sparse.csr_matrix(
-                (ai_conectivity, (ai_edge[:,0], ai_edge[:,1])),
-                shape = (df_cell.shape[0], df_cell.shape[0]),
-                dtype = np.uint
-            )
-            # handle distance data
-            ar_distance  = np.array(lr_distance, dtype=np.float64)
-            ar_distance_sparse = sparse.csr_matrix(
-                (ar_distance, (ai_edge[:,0], ai_edge[:,1])),
-                shape = (df_cell.shape[0], df_cell.shape[0]),
-                dtype = np.float64
-            )
-            # pack obsp
-            d_obsp.update({
-                f'physicell_{s_graph}_conectivities': ai_conectivity_sparse,
-                f'physicell_{s_graph}_distances': ar_distance_sparse,
-            })
-            # pack uns
-            d_uns.update({
-                s_graph : {
-                    'connectivities_key': f'physicell_{s_graph}_conectivities',
-                    'distances_key': f'physicell_{s_graph}_distances',
-                    'params': {
-                        'metric': 'euclidean',
-                        'method': graph_method,
+    # skip graph processing entirely if there are no graphs
+    if (len(graph_neighbor) > 0) or (len(graph_attached) > 0):
+        # extract cell_id to index mapping.
+        # as dense lookup array, if the cell ids are compact, like PhysiCell assigns them,
+        # else as dict, so that a sparse cell id space does not allocate max id + 1 entries.
+        i_ididx = ai_id.max(initial=-1) + 1
+        b_dense = (ai_id.min(initial=0) >= 0) and (i_ididx <= 2 * ai_id.shape[0] + 1024)
+        if b_dense:
+            ai_ididx = np.full(i_ididx, -1, dtype=np.int32)
+            ai_ididx[ai_id] = np.arange(ai_id.shape[0], dtype=np.int32)
+        else:
+            di_ididx = dict(zip(ai_id.tolist(), range(ai_id.shape[0])))
+        for s_graph, dei_graph in [('neighbor', graph_neighbor), ('attached', graph_attached)]:
+            # skip empty graph
+            if (len(dei_graph) == 0):
+                continue
+            # extract edges as cell ids into a preallocated array
+            i_edge = sum([len(ei_dst) for ei_dst in dei_graph.values()])
+            ai_idedge = np.empty((i_edge, 2), dtype=np.int64)
+            i_start = 0
+            for i_src, ei_dst in dei_graph.items():
+                i_stop = i_start + len(ei_dst)
+                ai_idedge[i_start:i_stop, 0] = i_src
+                ai_idedge[i_start:i_stop, 1] = list(ei_dst)
+                i_start = i_stop
+            # map cell ids to index, -1 marks cell ids that are not in df_cell
+            if b_dense:
+                ai_edge = np.full((i_edge, 2), -1, dtype=np.int32)
+                ab_range = (ai_idedge >= 0) & (ai_idedge < i_ididx)
+                ai_edge[ab_range] = ai_ididx[ai_idedge[ab_range]]
+            else:
+                ai_edge = np.array([di_ididx.get(i_id, -1) for i_id in ai_idedge.ravel().tolist()], dtype=np.int32).reshape(i_edge, 2)
+            if (ai_edge < 0).any():
+                li_unknown = np.unique(ai_idedge[ai_edge < 0]).tolist()
+                raise KeyError(f"Error @ pyAnnData._anndextract : {s_graph} graph cell ids {li_unknown} are not in df_cell.")
+            # if there is a graph
+            if (i_edge > 0):
+                # sort edges once by row and column,
+                # so that both sparse matrices can share one csr index structure
+                ai_order = np.lexsort((ai_edge[:,1], ai_edge[:,0]))
+                ai_edge = ai_edge[ai_order]
+                ai_indices = ai_edge[:,1].copy()
+                ai_indptr = np.searchsorted(ai_edge[:,0], np.arange(df_cell.shape[0] + 1)).astype(np.int32)
+                # handle connection data
+                ai_conectivity = np.ones(ai_edge.shape[0], dtype=np.int8)
+                ai_conectivity_sparse = sparse.csr_matrix(
+                    (ai_conectivity, ai_indices, ai_indptr),
+                    shape = (df_cell.shape[0], df_cell.shape[0]),
+                    dtype = np.int8
+                )
+                # handle distance data (gather all edge coordinates at once)
+                ar_diff = ar_coor[ai_edge[:,0]] - ar_coor[ai_edge[:,1]]
+                ar_distance = np.sqrt(np.einsum('ij,ij->i', ar_diff, ar_diff)).astype(np.float32)
+                ar_distance_sparse = sparse.csr_matrix(
+                    (ar_distance, ai_indices, ai_indptr),
+                    shape = (df_cell.shape[0], df_cell.shape[0]),
+                    dtype = np.float32
+                )
+                # pack obsp
+                d_obsp.update({
+                    f'physicell_{s_graph}_conectivities': ai_conectivity_sparse,
+                    f'physicell_{s_graph}_distances': ar_distance_sparse,
+                })
+                # pack uns
+                d_uns.update({
+                    s_graph : {
+                        'connectivities_key': f'physicell_{s_graph}_conectivities',
+                        'distances_key': f'physicell_{s_graph}_distances',
+                        'params': {
+                            'metric': 'euclidean',
+                            'method': graph_method,
+                        }
                     }
-                }
-            })
+                })
 
     # extract discrete cell data
     es_drop = set(df_cell.columns).intersection({
@@ -227,35 +272,59 @@ def _anndextract(df_cell, scale='maxabs', graph_attached={}, graph_neighbor={},
         'position_x', 'position_y','position_z',
         'time', 'runtime', 'xmlfile',
     })
-    df_cell.drop(es_drop, axis=1, inplace=True)  # maybe obs?
+    df_cell = df_cell.loc[:,[s_column for s_column in df_cell.columns if not (s_column in es_drop)]]  # maybe obs?
 
     # dectect variable types
-    des_type = {'float': set(), 'int': set(), 'bool': set(), 'str': set()}
-    for _, se_cell in df_cell.items():
-        if str(se_cell.dtype).startswith('float'):
-            des_type['float'].add(se_cell.name)
-        elif str(se_cell.dtype).startswith('int'):
-            des_type['int'].add(se_cell.name)
-        elif str(se_cell.dtype).startswith('bool'):
-            des_type['bool'].add(se_cell.name)
-        elif str(se_cell.dtype).startswith('object'):
-            des_type['str'].add(se_cell.name)
-        else:
-            print(f'Error @ TimeSeries.get_anndata : column {se_cell.name} detected with unknown dtype {str(se_cell.dtype)}.')
+    df_cat = df_cell.select_dtypes(include=['object'])
+    df_count = df_cell.select_dtypes(include=['number', 'bool'])
+    for s_column in sorted(set(df_cell.columns).difference(df_cat.columns).difference(df_count.columns)):
+        print(f'Error @ TimeSeries.get_anndata : column {s_column} detected with unknown dtype {str(df_cell.loc[:,s_column].dtype)}.')
 
     # build on obs and X anndata object
-    df_cat = df_cell.loc[:,sorted(des_type['str'])].copy()
-    df_obs = pd.merge(df_obs, df_cat, left_index=True, right_index=True)
-    es_num = des_type['float'].union(des_type['int'].union(des_type['bool']))
-    df_count = df_cell.loc[:,sorted(es_num)].copy()
-    for s_col in des_type['bool']:
-        df_count[s_col] = df_count[s_col].astype(int)
+    df_cat = df_cat.loc[:,sorted(df_cat.columns)]
+    df_obs = pd.concat([df_obs, df_cat], axis=1)  # same index, no join needed
+    df_count = df_count.astype({s_column: int for s_column in df_count.select_dtypes(include=['bool']).columns})
+    df_count = df_count.loc[:,sorted(df_count.columns)]
     df_count = scaler(df_count, scale=scale)
 
     # return
+    if return_anndata:
+        annmcds = ad.AnnData(
+            X = np.ascontiguousarray(df_count.to_numpy(), dtype=np.float32),
+            obs = df_obs,
+            var = pd.DataFrame(index=df_count.columns),
+            obsm = d_obsm,
+            obsp = d_obsp,
+            uns = d_uns
+        )
+        return annmcds
     return(df_count, df_obs, d_obsm, d_obsp, d_uns)
 
 
+def _anndextract_legacy(df_cell, scale='maxabs', graph_attached={}, graph_neighbor={}, graph_method='PhysiCell'):
+    """
+    input:
+        df_cell, scale, graph_attached, graph_neighbor, graph_method:
+            for input, check out: help(pcdl.pyAnnData._anndextract).
+
+    output:
+        df_count, df_obs, d_obsm, d_obsp, d_uns dataframes and dictionaries,
+            ready to be backed into an anndata object.
+
+    description:
+        function always returns the tuple of dataframes and dictionaries,
+        like _anndextract did before the return_anndata parameter was added.
+    """
+    return _anndextract(
+        df_cell = df_cell,
+        scale = scale,
+        graph_attached = graph_attached,
+        graph_neighbor = graph_neighbor,
+        graph_method = graph_method,
+        return_anndata = False,
+    )
+
+
 # class definition
 class TimeStep(pyMCDS):
     def __init__(self, xmlfile, output_path='.', custom_type={}, microenv=True, graph=True, physiboss=True, settingxml='PhysiCell_settings.xml', verbose=True):
@@ -360,19 +429,13 @@ class TimeStep(pyMCDS):
         if self.verbose:
             print(f'processing: 1/1 {round(self.get_time(),9)}[min] mcds into anndata obj.')
         df_cell = self.get_cell_df(values=values, drop=drop, keep=keep)
-        df_count, df_obs, d_obsm, d_obsp, d_uns = _anndextract(
+        annmcds = _anndextract(
             df_cell = df_cell,
             scale = scale,
             graph_attached = self.get_attached_graph_dict(),
             graph_neighbor = self.get_neighbor_graph_dict(),
             graph_method = self.get_physicell_version(),
-        )
-        annmcds = ad.AnnData(
-            X = df_count,
-            obs = df_obs,
-            obsm = d_obsm,
-            obsp = d_obsp,
-            uns = d_uns
+            return_anndata = True,
         )
         # output
         return annmcds
@@ -556,28 +619,22 @@ class TimeSeries(pyMCDSts):
             # pack not collapsed
             else:
                 # extract
-                df_count, df_obs, d_obsm, d_obsp, d_uns = _anndextract(
+                ann_mcds = _anndextract(
                     df_cell=df_cell,
                     scale = scale,
                     graph_attached = mcds.get_attached_graph_dict(),
                     graph_neighbor = mcds.get_neighbor_graph_dict(),
                     graph_method = s_physicellv,
-                )
-                # annmcds
-                ann_mcds = ad.AnnData(
-                    X = df_count,
-                    obs = df_obs,
-                    obsm = d_obsm,
-                    obsp = d_obsp,
-                    uns = d_uns,
+                    return_anndata = True,
                 )
                 lann_mcds.append(ann_mcds)
 
         # output
         if collapse:
             ann_mcdsts = ad.AnnData(
-                X = df_anncount,
+                X = np.ascontiguousarray(df_anncount.to_numpy(), dtype=np.float32),
                 obs = df_annobs,
+                var = pd.DataFrame(index=df_anncount.columns),
                 obsm = {'spatial': ar_annobsm},
                 #obsp = d_obsp,
                 #uns = d_uns
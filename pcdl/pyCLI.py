@@ -1308,7 +1308,7 @@ def plot_scatter():
     # argv
     parser = argparse.ArgumentParser(
         prog = 'pcdl_plot_scatter',
-        description = 'function generates pandas scatter plots, under the returned path.',
+        description = 'function generates matplotlib scatter plots, under the returned path.',
         epilog = 'homepage: https://github.com/elmbeech/physicelldataloader',
     )
 
@@ -15,72 +15,83 @@
 
 
 # load library
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import mmap
 import matplotlib.pyplot as plt
 from matplotlib import cm
 from matplotlib import colors
 import numpy as np
 import os
 import pandas as pd
+from pandas.api import types as pdt
 from pcdl import pdplt
 from scipy import io
 import sys
-import vtk
-from vtkmodules.vtkCommonCore import vtkPoints
-import xml.etree.ElementTree as ET
+import threading
+from types import MappingProxyType
+try:
+    from lxml import etree as ET
+    do_xmlparser = {'remove_comments': True, 'remove_pis': True, 'huge_tree': True, 'collect_ids': False}
+    do_iterparse = {'remove_comments': True, 'remove_pis': True, 'huge_tree': True}
+except ModuleNotFoundError:
+    import xml.etree.ElementTree as ET
+    do_xmlparser = None
+    do_iterparse = {}
 from pcdl.VERSION import __version__
 
 
 # const physicell codec
 # implemation based on PhysiCell/core/PhysiCell_constants.h.
-ds_cycle_model = {
-    '0' : 'advanced_Ki67_cycle_model',
-    '1' : 'basic_Ki67_cycle_model',
-    '2' : 'flow_cytometry_cycle_model',
-    '3' : 'live_apoptotic_cycle_model',
-    '4' : 'total_cells_cycle_model',
-    '5' : 'live_cells_cycle_model',
-    '6' : 'flow_cytometry_separated_cycle_model',
-    '7' : 'cycling_quiescent_model',
-}
-ds_death_model = {
-    '100' : 'apoptosis_death_model',
-    '101' : 'necrosis_death_model',
-    '102' : 'autophagy_death_model',
-    '9999' : 'custom_cycle_model',
-}
-
-ds_cycle_phase = {
-    '0' : 'Ki67_positive_premitotic',
-    '1' : 'Ki67_positive_postmitotic',
-    '2' : 'Ki67_positive',
-    '3' : 'Ki67_negative',
-    '4' : 'G0G1_phase',
-    '5' : 'G0_phase',
-    '6' : 'G1_phase',
-    '7' : 'G1a_phase',
-    '8' : 'G1b_phase',
-    '9' : 'G1c_phase',
-    '10' : 'S_phase',
-    '11' : 'G2M_phase',
-    '12' : 'G2_phase',
-    '13' : 'M_phase',
-    '14' : 'live',
-    '15' : 'G1pm_phase',
-    '16' : 'G1ps_phase',
-    '17' : 'cycling',
-    '18' : 'quiescent',
-    '9999' : 'custom_phase',
-}
-ds_death_phase = {
-    '100' : 'apoptotic',
-    '101' : 'necrotic_swelling',
-    '102' : 'necrotic_lysed',
-    '103' : 'necrotic',
-    '104' : 'debris',
-}
+ds_cycle_model = MappingProxyType({
+    0 : 'advanced_Ki67_cycle_model',
+    1 : 'basic_Ki67_cycle_model',
+    2 : 'flow_cytometry_cycle_model',
+    3 : 'live_apoptotic_cycle_model',
+    4 : 'total_cells_cycle_model',
+    5 : 'live_cells_cycle_model',
+    6 : 'flow_cytometry_separated_cycle_model',
+    7 : 'cycling_quiescent_model',
+})
+ds_death_model = MappingProxyType({
+    100 : 'apoptosis_death_model',
+    101 : 'necrosis_death_model',
+    102 : 'autophagy_death_model',
+    9999 : 'custom_cycle_model',
+})
+
+ds_cycle_phase = MappingProxyType({
+    0 : 'Ki67_positive_premitotic',
+    1 : 'Ki67_positive_postmitotic',
+    2 : 'Ki67_positive',
+    3 : 'Ki67_negative',
+    4 : 'G0G1_phase',
+    5 : 'G0_phase',
+    6 : 'G1_phase',
+    7 : 'G1a_phase',
+    8 : 'G1b_phase',
+    9 : 'G1c_phase',
+    10 : 'S_phase',
+    11 : 'G2M_phase',
+    12 : 'G2_phase',
+    13 : 'M_phase',
+    14 : 'live',
+    15 : 'G1pm_phase',
+    16 : 'G1ps_phase',
+    17 : 'cycling',
+    18 : 'quiescent',
+    9999 : 'custom_phase',
+})
+ds_death_phase = MappingProxyType({
+    100 : 'apoptotic',
+    101 : 'necrotic_swelling',
+    102 : 'necrotic_lysed',
+    103 : 'necrotic',
+    104 : 'debris',
+})
 
 # const physicell variable names
-es_var_subs = {
+es_var_subs = frozenset({
     'chemotactic_sensitivities',
     'fraction_released_at_death',
     'fraction_transferred_when_ingested',
@@ -89,27 +100,27 @@ es_var_subs = {
     'saturation_densities',
     'secretion_rates',
     'uptake_rates',
-}
-es_var_death = {
+})
+es_var_death = frozenset({
     'death_rates',
-}
-es_var_cell = {
+})
+es_var_cell = frozenset({
     'attack_rates',
     'cell_adhesion_affinities',
     'fusion_rates',
     'live_phagocytosis_rates',
     'transformation_rates',
-}
-es_var_spatial = {
+})
+es_var_spatial = frozenset({
     'migration_bias_direction',
     'motility_vector',
     'orientation',
     'position',
     'velocity',
-}
+})
 
 # const physicell variable types
-do_var_type = {
+do_var_type = MappingProxyType({
     # integer
     'ID': int,
     'cell_count_voxel': int,
@@ -125,27 +136,71 @@ do_var_type = {
     'current_death_model': str,  # codec mapping
     'current_phase': str,  # codec mapping
     'cycle_model': str,  # codec mapping
-}
+})
 
 # const coordinate variable names
-es_coor_conc = {
+es_coor_conc = frozenset({
     'ID',
     'voxel_i','voxel_j','voxel_k',
     'mesh_center_m','mesh_center_n','mesh_center_p',
     'time', 'runtime',
     'xmlfile',
-}
-es_coor_cell = {
+})
+es_coor_cell = frozenset({
     'ID',
     'voxel_i', 'voxel_j', 'voxel_k',
     'mesh_center_m', 'mesh_center_n', 'mesh_center_p',
     'position_x', 'position_y', 'position_z',
     'time', 'runtime',
     'xmlfile',
-}
+})
+
+
+# module level caches
+# the caches are shared by all pyMCDS instances and read and written from
+# the graph and pyMCDSts.read_mcds thread pools, so every lookup, insert,
+# and eviction is guarded by this lock.
+o_cache_lock = threading.Lock()
+
+# settings xml cache
+# PhysiCell_settings.xml is the same for every time step of a run,
+# key is (absolute path/file, modification time in ns).
+i_setting_cache = 8
+do_setting_cache = {}
+
+# graph file cache
+# key is (absolute path/file, modification time in ns, file size in bytes).
+# the cache is bounded by the total number of stored cell ids, not by the number of files,
+# so that the graphs of a whole usual time series fit (2**24 ids, at most 64 MB as int32).
+i_graph_cache = 2**24
+do_graph_cache = {}
 
 
 # functions
+def _graphfile_lines(s_pathfile):
+    """
+    input:
+        s_pathfile: string
+            path to and file name from graph.txt file.
+
+    output:
+        generator of tuples of bytes
+            yields for each line the cell ID and the comma separated
+            connected cell IDs part.
+
+    description:
+        internal function to read a graph file line by line
+        straight from a read only memory map, without holding
+        a copy of the whole file content in memory.
+    """
+    if (os.stat(s_pathfile).st_size > 0):
+        with open(s_pathfile, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for b_line in iter(mm.readline, b''):
+                    b_key, _, b_value = b_line.rstrip(b'\r\n').partition(b':')
+                    yield (b_key, b_value)
+
+
 def graphfile_parser(s_pathfile):
     """
     input:
@@ -162,20 +217,210 @@ def graphfile_parser(s_pathfile):
     """
     # processing
     dei_graph = {}
-    f = open(s_pathfile)
-    for i, s_line in enumerate(f):
-        #print('processing line:', s_line.strip())
-        s_key, s_value = s_line.strip().split(':')
+    for b_key, b_value in _graphfile_lines(s_pathfile):
         ei_value = set()
-        if len(s_value.strip()) :
-            ei_value = set([int(s_id) for s_id in s_value.split(',')])
-        dei_graph.update({int(s_key): ei_value})
-    f.close()
+        if len(b_value.strip()) :
+            ei_value = set(map(int, b_value.split(b',')))
+        dei_graph[int(b_key)] = ei_value
 
     # output
     return dei_graph
 
 
+def _graphfile_parser_cache(s_pathfile):
+    """
+    input:
+        s_pathfile: string
+            path to and file name from graph.txt file.
+
+    output:
+        dei_graph: dictionary of sets of integers.
+            object maps each cell ID to connected cell IDs.
+
+    description:
+        function parses a graph file, like graphfile_parser, only
+        if the same file, unmodified, was not parsed before.
+        the cache is shared between threads and evicts the least recently
+        used graphs. it stores the parsed graph in csr layout, as cell id,
+        index pointer, and connected cell id numpy arrays, in the
+        smallest integer type that can hold the cell ids.
+        the caller always gets fresh sets, which is cheaper than
+        parsing the file again.
+    """
+    o_stat = os.stat(s_pathfile)
+    t_graph = (os.path.abspath(s_pathfile), o_stat.st_mtime_ns, o_stat.st_size)
+    with o_cache_lock:
+        tai_graph = do_graph_cache.pop(t_graph, None)
+        if not (tai_graph is None):
+            do_graph_cache[t_graph] = tai_graph  # most recently used goes last
+
+    if (tai_graph is None):
+        # processing, keep the file order, so that the sets are built like in graphfile_parser.
+        # the csr lists are filled in the same pass, no repacking needed.
+        dei_graph = {}
+        li_src = []
+        li_indptr = [0]
+        li_dst = []
+        for b_key, b_value in _graphfile_lines(s_pathfile):
+            li_value = []
+            if len(b_value.strip()) :
+                li_value = list(map(int, b_value.split(b',')))
+            i_src = int(b_key)
+            dei_graph[i_src] = set(li_value)
+            li_src.append(i_src)
+            li_dst.extend(li_value)
+            li_indptr.append(len(li_dst))
+
+        # narrow the integer type
+        i_max = max(max(li_src, default=0), max(li_dst, default=0), li_indptr[-1])
+        o_dtype = np.int64
+        for o_narrow in [np.int16, np.int32]:
+            if (i_max <= np.iinfo(o_narrow).max):
+                o_dtype = o_narrow
+                break
+        tai_graph = (np.array(li_src, dtype=o_dtype), np.array(li_indptr, dtype=o_dtype), np.array(li_dst, dtype=o_dtype))
+
+        # store and evict the least recently used graphs
+        with o_cache_lock:
+            do_graph_cache[t_graph] = tai_graph
+            i_id = sum([ai_src.shape[0] + ai_dst.shape[0] for ai_src, _, ai_dst in do_graph_cache.values()])
+            while (i_id > i_graph_cache) and (len(do_graph_cache) > 1):
+                ai_src, _, ai_dst = do_graph_cache.pop(next(iter(do_graph_cache)))
+                i_id -= ai_src.shape[0] + ai_dst.shape[0]
+
+    else:
+        # unpack csr arrays, the cached arrays are never modified
+        li_src, li_indptr, li_dst = [ai_graph.tolist() for ai_graph in tai_graph]
+        dei_graph = {i_src: set(li_dst[li_indptr[i]:li_indptr[i+1]]) for i, i_src in enumerate(li_src)}
+
+    # output
+    return dei_graph
+
+
+def _iterparse_xml(s_pathfile, es_section):
+    """
+    input:
+        s_pathfile: string
+            path to and file name from xml file.
+
+        es_section: set of strings
+            tags of the root's child nodes that should be kept.
+
+    output:
+        x_root: xml element
+            root node, holding only the requested child nodes.
+
+    description:
+        function stream parses a xml file with iterparse and
+        clears every root child node, not listed in es_section,
+        as soon as the node is read, so that the full document tree
+        is never held in memory.
+    """
+    x_root = None
+    i_depth = 0
+    for s_event, x_element in ET.iterparse(s_pathfile, events=('start', 'end'), **do_iterparse):
+        if (s_event == 'start'):
+            if (x_root is None):
+                x_root = x_element
+            i_depth += 1
+        else:
+            i_depth -= 1
+            if (i_depth == 1) and not (x_element.tag in es_section):
+                x_element.clear()
+                x_root.remove(x_element)
+    return x_root
+
+
+def _axis_index(r_value, r_origin, r_spacing):
+    """
+    input:
+        r_value: floating point number
+            coordinate value.
+
+        r_origin: floating point number
+            first mesh center on this axis.
+
+        r_spacing: floating point number
+            mesh spacing on this axis.
+
+    output:
+        i_index: integer
+            index of the mesh center nearest to r_value.
+
+    description:
+        function computes for a uniform mesh the axis index by plain
+        python float arithmetic, which for a single coordinate is much
+        faster than the equivalent numpy scalar operations.
+        like np.round, rounding is half to even.
+    """
+    return int(round((float(r_value) - float(r_origin)) / float(r_spacing)))
+
+
+def _axis_voxel_index(ar_axis, ar_center):
+    """
+    input:
+        ar_axis: numpy array of floating point numbers
+            sorted mesh center axis.
+
+        ar_center: numpy array of floating point numbers
+            voxel center coordinates on this axis.
+
+    output:
+        ai_voxel: numpy array of integers
+            for each voxel center, the index of the nearest mesh center.
+
+    description:
+        function computes the voxel index for many voxel centers at once.
+        for a uniform mesh, the index is computed from the mesh spacing,
+        like in _axis_index.
+        for a non-uniform mesh, each index is looked up by binary search,
+        like in _snap_to_axis, the smaller one, if the voxel center lies
+        on a saddle point.
+    """
+    i_last = ar_axis.shape[0] - 1
+    if (i_last < 1):
+        return np.zeros(ar_center.shape[0], dtype=np.intp)
+
+    # uniform mesh
+    r_spacing = (ar_axis[-1] - ar_axis[0]) / i_last
+    ai_voxel = np.clip(np.rint((ar_center - ar_axis[0]) / r_spacing).astype(np.intp), 0, i_last)
+    if (np.abs(ar_center - ar_axis[ai_voxel]) < 1e-10).all():
+        return ai_voxel
+
+    # non-uniform mesh
+    ai_right = np.clip(np.searchsorted(ar_axis, ar_center), 0, i_last)
+    ai_left = np.clip(ai_right - 1, 0, i_last)
+    ai_voxel = np.where((ar_center - ar_axis[ai_left]) <= (ar_axis[ai_right] - ar_center), ai_left, ai_right)
+    return ai_voxel
+
+
+def _snap_to_axis(ar_axis, r_value):
+    """
+    input:
+        ar_axis: numpy array of floating point numbers
+            sorted mesh center axis.
+
+        r_value: floating point number
+            coordinate value.
+
+    output:
+        r_center: floating point number
+            the mesh center nearest to r_value.
+
+    description:
+        function returns the mesh center value closest to r_value,
+        the smaller one, if the coordinate lies on a saddle point.
+        because the axis is sorted, a binary search is used,
+        instead of a full scan over the axis.
+    """
+    i = int(np.searchsorted(ar_axis, r_value))
+    if (i == ar_axis.shape[0]):
+        i -= 1
+    elif (i > 0) and ((r_value - ar_axis[i-1]) <= (ar_axis[i] - r_value)):
+        i -= 1
+    return ar_axis[i]
+
+
 # object classes
 class pyMCDS:
     def __init__(self, xmlfile, output_path='.', custom_type={}, microenv=True, graph=True, physiboss=True, settingxml='PhysiCell_settings.xml', verbose=True):
@@ -240,6 +485,7 @@ class pyMCDS:
             settingxml = settingxml.replace('\\','/').split('/')[-1]
         self.settingxml = settingxml
         self.verbose = verbose
+        self.cache = False
         self.data = self._read_xml(xmlfile, output_path)
         self.get_concentration_df = self.get_conc_df
 
@@ -267,6 +513,49 @@ class pyMCDS:
         """
         self.verbose = True
 
+    def set_cache_false(self):
+        """
+        input:
+
+        output:
+            set cache false and clear the cache.
+
+        description:
+            function to stop caching the unfiltered
+            get_cell_df and get_conc_df dataframes.
+        """
+        self.cache = False
+        self.clear_cache()
+
+    def set_cache_true(self):
+        """
+        input:
+
+        output:
+            set cache true.
+
+        description:
+            function to cache the unfiltered get_cell_df and get_conc_df
+            dataframes, the first time they are built.
+            this speeds up repeated get_cell_df, get_conc_df, and
+            plot calls on the same time step, for the cost of keeping
+            the full dataframes in memory. default is False.
+        """
+        self.cache = True
+
+    def clear_cache(self):
+        """
+        input:
+
+        output:
+            cleared cache.
+
+        description:
+            function to free the cached unfiltered
+            get_cell_df and get_conc_df dataframes.
+        """
+        self.data['cache'] = {'df_cell': None, 'df_conc': None}
+
 
     ## METADATA RELATED FUNCTIONS ##
 
@@ -440,14 +729,14 @@ class pyMCDS:
             mesh center coordinate values from one particular axis.
             the function can either return meshgrids for the full
             m, n, p 3D cube, or only the 2D planes along the p-axis.
+            the meshgrids are generated on each call from the mesh center axes.
         """
+        ar_m_axis, ar_n_axis, ar_p_axis = self.data['mesh']['mnp_axis']
         if flat:
-            ar_m = self.data['mesh']['mnp_grid'][0][:, :, 0]
-            ar_n = self.data['mesh']['mnp_grid'][1][:, :, 0]
-            return np.array([ar_m, ar_n]).copy()
+            return np.array(np.meshgrid(ar_m_axis, ar_n_axis, indexing='xy'))
 
         else:
-            return self.data['mesh']['mnp_grid'].copy()
+            return np.array(np.meshgrid(ar_m_axis, ar_n_axis, ar_p_axis, indexing='xy'))
 
 
     def get_mesh_2D(self):
@@ -476,9 +765,9 @@ class pyMCDS:
 
         description:
             function returns three vectors with mesh center coordinate values,
-            one for each axis.
+            one for each axis. the returned array is read-only.
         """
-        return self.data['mesh']['mnp_coordinate'].copy()
+        return self.data['mesh']['mnp_coordinate']
 
 
     def get_mesh_spacing(self):
@@ -493,16 +782,18 @@ class pyMCDS:
             function returns the distance in between mesh centers,
             in the spacial unit defined in the PhysiCell_settings.xml file.
         """
-        tr_m_range, tr_n_range, tr_p_range = self.get_mesh_mnp_range()
-        ar_m_axis, ar_n_axis, ar_p_axis = self.get_mesh_mnp_axis()
+        if not ('mnp_spacing' in self.data['mesh'].keys()):
+            tr_m_range, tr_n_range, tr_p_range = self.data['mesh']['mnp_range']
+            ar_m_axis, ar_n_axis, ar_p_axis = self.data['mesh']['mnp_axis']
 
-        dm = (tr_m_range[1] - tr_m_range[0]) / (ar_m_axis.shape[0] - 1)
-        dn = (tr_n_range[1] - tr_n_range[0]) / (ar_n_axis.shape[0] - 1)
-        if (len(set(tr_p_range)) == 1):
-            dp = np.float64(1.0)
-        else:
-            dp = (tr_p_range[1] - tr_p_range[0]) / (ar_p_axis.shape[0] - 1)
-        return [dm, dn, dp]
+            dm = (tr_m_range[1] - tr_m_range[0]) / (ar_m_axis.shape[0] - 1)
+            dn = (tr_n_range[1] - tr_n_range[0]) / (ar_n_axis.shape[0] - 1)
+            if (tr_p_range[0] == tr_p_range[1]):
+                dp = np.float64(1.0)
+            else:
+                dp = (tr_p_range[1] - tr_p_range[0]) / (ar_p_axis.shape[0] - 1)
+            self.data['mesh']['mnp_spacing'] = (dm, dn, dp)
+        return list(self.data['mesh']['mnp_spacing'])
 
 
     def is_in_mesh(self, x, y, z, halt=False):
@@ -534,7 +825,7 @@ class pyMCDS:
         b_isinmesh = True
 
         # check against boundary box
-        tr_x, tr_y, tr_z = self.get_xyz_range()
+        tr_x, tr_y, tr_z = self.data['mesh']['xyz_range']
 
         if (x < tr_x[0]) or (x > tr_x[1]):
             print(f'Warning @ pyMCDS.is_in_mesh : x = {x} out of bounds: x-range is {tr_x}.')
@@ -552,6 +843,133 @@ class pyMCDS:
         return b_isinmesh
 
 
+    def is_in_mesh_batch(self, xyz, halt=False):
+        """
+        input:
+            xyz: numpy array of floating point numbers
+                array of shape (n, 3) with one x, y, z position
+                coordinate per row.
+
+            halt: boolean; default is False
+                should program execution break or just spit out a warning,
+                if any position is not in mesh?
+
+        output:
+            ab_isinmesh: numpy array of booleans
+                declares for each given coordinate if it is inside the mesh.
+
+        description:
+            function evaluates vectorized, if the given position coordinates
+            are inside the boundaries. if any coordinate is outside the
+            mesh, a warning will be printed. if additionally
+            halt is set to True, program execution will break.
+        """
+        ar_xyz = np.asarray(xyz, dtype=np.float64).reshape(-1, 3)
+
+        # check against boundary box
+        ar_range = np.array(self.data['mesh']['xyz_range'], dtype=np.float64)
+        ab_isinmesh = ((ar_xyz >= ar_range[:,0]) & (ar_xyz <= ar_range[:,1])).all(axis=1)
+
+        i_out = ab_isinmesh.shape[0] - ab_isinmesh.sum()
+        if (i_out > 0):
+            print(f'Warning @ pyMCDS.is_in_mesh_batch : {i_out} of {ab_isinmesh.shape[0]} positions out of bounds: xyz-range is {self.get_xyz_range()}.')
+
+        # output
+        if halt and (i_out > 0):
+            sys.exit('Processing stopped!')
+        return ab_isinmesh
+
+
+    def get_mesh_mnp(self, x, y, z, is_in_mesh=True):
+        """
+        input:
+            x: floating point number
+                position x-coordinate.
+
+            y: floating point number
+                position y-coordinate.
+
+            z: floating point number
+                position z-coordinate.
+
+            is_in_mesh: boolean; default is True
+                should function check, if the given coordinate is in the mesh,
+                and only calculate mnp values if is so?
+
+        output:
+            lr_mnp : list of 3 floating point numbers
+                m, n, p mesh center coordinate for the voxel
+                containing the x, y, z position.
+
+        description:
+            function returns the mesh center m, n, p
+            for the given position x, y, z.
+            because the mesh is uniform, the mesh center index is
+            computed directly from the mesh origin and spacing,
+            instead of searching along each axis.
+        """
+        lr_mnp = None
+        b_calc = True
+
+        if is_in_mesh:
+            b_calc = self.is_in_mesh(x=x, y=y, z=z, halt=False)
+
+        if b_calc:
+            lr_mnp = []
+            for r_xyz, tr_mnp, r_spacing, ar_axis in zip(
+                    (x, y, z),
+                    self.data['mesh']['mnp_range'],
+                    self.get_mesh_spacing(),
+                    self.data['mesh']['mnp_axis'],
+                ):
+                i = _axis_index(r_xyz, tr_mnp[0], r_spacing)
+                i = min(max(i, 0), ar_axis.shape[0] - 1)
+                lr_mnp.append(ar_axis[i])
+
+        return lr_mnp
+
+
+    def get_mesh_mnp_batch(self, xyz, is_in_mesh=True):
+        """
+        input:
+            xyz: numpy array of floating point numbers
+                array of shape (n, 3) with one x, y, z position
+                coordinate per row.
+
+            is_in_mesh: boolean; default is True
+                should function check, if the given coordinates are in the mesh,
+                and only calculate mnp values for those which are?
+
+        output:
+            ar_mnp : numpy array of floating point numbers
+                array of shape (n, 3) with the m, n, p mesh center coordinate
+                for the voxel containing each x, y, z position.
+                rows of positions outside the mesh are set to nan.
+
+        description:
+            function returns vectorized the mesh centers m, n, p
+            for the given positions x, y, z.
+        """
+        ar_xyz = np.asarray(xyz, dtype=np.float64).reshape(-1, 3)
+
+        # compute mesh center index
+        ar_origin = np.array([tr_mnp[0] for tr_mnp in self.data['mesh']['mnp_range']], dtype=np.float64)
+        ar_spacing = np.array(self.get_mesh_spacing(), dtype=np.float64)
+        ai_max = np.array([ar_axis.shape[0] - 1 for ar_axis in self.data['mesh']['mnp_axis']])
+        ai_mnp = np.clip(np.rint((ar_xyz - ar_origin) / ar_spacing).astype(np.intp), 0, ai_max)
+
+        # look up mesh center
+        ar_mnp = np.empty(ar_xyz.shape, dtype=np.float64)
+        for i, ar_axis in enumerate(self.data['mesh']['mnp_axis']):
+            ar_mnp[:,i] = ar_axis[ai_mnp[:,i]]
+
+        if is_in_mesh:
+            ab_isinmesh = self.is_in_mesh_batch(xyz=ar_xyz, halt=False)
+            ar_mnp[~ab_isinmesh,:] = np.nan
+
+        return ar_mnp
+
+
     def get_voxel_spacing(self):
         """
         input:
@@ -563,11 +981,15 @@ class pyMCDS:
         description:
             function returns the voxel width, height, depth measurement,
             in the spacial unit defined in the PhysiCell_settings.xml file.
+            mesh spacing, voxel volume, and voxel spacing are computed
+            only once per time step and then cached.
         """
-        r_volume = self.get_voxel_volume()
-        dm, dn, _ = self.get_mesh_spacing()
-        dp  = r_volume / (dm * dn)
-        return [dm, dn, dp]
+        if not ('ijk_spacing' in self.data['mesh'].keys()):
+            r_volume = self.get_voxel_volume()
+            dm, dn, _ = self.get_mesh_spacing()
+            dp  = r_volume / (dm * dn)
+            self.data['mesh']['ijk_spacing'] = (dm, dn, dp)
+        return list(self.data['mesh']['ijk_spacing'])
 
 
     def get_voxel_volume(self):
@@ -583,11 +1005,12 @@ class pyMCDS:
             function returns the volume value for a single voxel, related
             to the spacial unit defined in the PhysiCell_settings.xml file.
         """
-        ar_volume = np.unique(self.data['mesh']['volumes'])
-        if ar_volume.shape != (1,):
-            sys.exit(f'Error @ pyMCDS.get_voxel_volume : mesh is not built out of a unique voxel volume {ar_volume}.')
-        r_volume = ar_volume[0]
-        return r_volume
+        if not ('ijk_volume' in self.data['mesh'].keys()):
+            ar_volume = self.data['mesh']['volumes'].ravel()
+            if (ar_volume.size == 0) or (ar_volume != ar_volume[0]).any():
+                sys.exit(f'Error @ pyMCDS.get_voxel_volume : mesh is not built out of a unique voxel volume {np.unique(ar_volume)}.')
+            self.data['mesh']['ijk_volume'] = ar_volume[0]
+        return self.data['mesh']['ijk_volume']
 
 
     def get_voxel_ijk(self, x, y, z, is_in_mesh=True):
@@ -622,18 +1045,67 @@ class pyMCDS:
             b_calc = self.is_in_mesh(x=x, y=y, z=z, halt=False)
 
         if b_calc:
-            tr_m, tr_n, tr_p = self.get_mesh_mnp_range()
+            tr_m, tr_n, tr_p = self.data['mesh']['mnp_range']
             dm, dn, dp = self.get_voxel_spacing()
 
-            i = int(np.round((x - tr_m[0]) / dm))
-            j = int(np.round((y - tr_n[0]) / dn))
-            k = int(np.round((z - tr_p[0]) / dp))
+            i = _axis_index(x, tr_m[0], dm)
+            j = _axis_index(y, tr_n[0], dn)
+            k = _axis_index(z, tr_p[0], dp)
 
             lr_ijk = [i, j, k]
 
         return lr_ijk
 
 
+    def get_voxel_ijk_batch(self, x, y, z, is_in_mesh=True):
+        """
+        input:
+            x: numpy array of floating point numbers
+                positions x-coordinate.
+
+            y: numpy array of floating point numbers
+                positions y-coordinate.
+
+            z: numpy array of floating point numbers
+                positions z-coordinate.
+
+            is_in_mesh: boolean; default is True
+                should function check, if the given coordinates are in the mesh?
+
+        output:
+            ai_ijk : numpy array of integers
+                array of shape (n, 3) with the i, j, k indices for the voxel
+                containing each x, y, z position.
+                indices are clipped to the voxel ijk range.
+
+            ab_isinmesh: numpy array of booleans or None
+                declares for each given coordinate if it is inside the mesh.
+                None, if is_in_mesh is False.
+
+        description:
+            function returns vectorized the meshgrid indices i, j, k
+            for the given positions x, y, z.
+        """
+        ar_xyz = np.column_stack([
+            np.asarray(x, dtype=np.float64).ravel(),
+            np.asarray(y, dtype=np.float64).ravel(),
+            np.asarray(z, dtype=np.float64).ravel(),
+        ])
+
+        # compute voxel index
+        ar_origin = np.array([tr_mnp[0] for tr_mnp in self.data['mesh']['mnp_range']], dtype=np.float64)
+        ar_spacing = np.array(self.get_voxel_spacing(), dtype=np.float64)
+        ar_range = np.array(self.data['mesh']['ijk_range'])
+        ai_ijk = np.rint((ar_xyz - ar_origin) / ar_spacing).astype(np.intp)
+        np.clip(ai_ijk, ar_range[:,0], ar_range[:,1], out=ai_ijk)
+
+        ab_isinmesh = None
+        if is_in_mesh:
+            ab_isinmesh = self.is_in_mesh_batch(xyz=ar_xyz, halt=False)
+
+        return ai_ijk, ab_isinmesh
+
+
     ## MICROENVIRONMENT RELATED FUNCTIONS ##
 
     def get_substrate_names(self):
@@ -725,23 +1197,26 @@ class pyMCDS:
             function returns the concentration meshgrid, or a xy-plain slice
             out of the whole meshgrid, for the specified chemical species.
         """
-        ar_conc = self.data['continuum_variables'][substrate]['data'].copy()
+        ar_conc = self.data['continuum_variables'][substrate]['data']
 
-        # check if z_slice is a mesh center or None
-        if not (z_slice is None):
+        # whole meshgrid
+        if (z_slice is None):
+            ar_conc = ar_conc.copy()
+
+        # check if z_slice is a mesh center
+        else:
             _, _, ar_p_axis = self.get_mesh_mnp_axis()
             if not (z_slice in ar_p_axis):
                 print(f'Warning @ pyMCDS.get_concentration : specified z_slice {z_slice} is not an element of the z-axis mesh centers set {ar_p_axis}.')
                 if halt:
                     sys.exit('Processing stopped!')
                 else:
-                    z_slice = ar_p_axis[abs(ar_p_axis - z_slice).argmin()]
+                    z_slice = _snap_to_axis(ar_p_axis, z_slice)
                     print(f'z_slice set to {z_slice}.')
 
             # filter by z_slice
-            _, _, ar_p_grid = self.get_mesh()
-            mask = ar_p_grid == z_slice
-            ar_conc = ar_conc[mask].reshape((ar_p_grid.shape[0], ar_p_grid.shape[1]))
+            k = np.where(ar_p_axis == z_slice)[0][0]
+            ar_conc = ar_conc[:,:,k].copy()
 
         # output
         return ar_conc
@@ -790,7 +1265,60 @@ class pyMCDS:
         return ar_concs
 
 
-    def get_conc_df(self, z_slice=None, halt=False, values=1, drop=set(), keep=set()):
+    def _get_conc_df_cache(self):
+        """
+        input:
+            self: pyMCDS class instance.
+
+        output:
+            df_conc: pandas dataframe
+                unfiltered, unsorted voxel centric dataframe, rows in C order
+                of the [j,i,k] meshgrid. this might be the cached object itself,
+                callers must not modify it.
+
+        description:
+            internal function to build the full concentration dataframe,
+            and, if caching is set true, cache it.
+        """
+        df_conc = self.data['cache']['df_conc']
+        if (df_conc is None):
+            # flat mesh coordnates, in C order of the [j,i,k] meshgrid, without building the meshgrid
+            ar_m_axis, ar_n_axis, ar_p_axis = self.data['mesh']['mnp_axis']
+            ar_m = np.tile(np.repeat(ar_m_axis, ar_p_axis.shape[0]), ar_n_axis.shape[0])
+            ar_n = np.repeat(ar_n_axis, ar_m_axis.shape[0] * ar_p_axis.shape[0])
+            ar_p = np.tile(ar_p_axis, ar_n_axis.shape[0] * ar_m_axis.shape[0])
+
+            # flat voxel coordinates, same order, in the smallest integer type
+            ai_i_axis, ai_j_axis, ai_k_axis = self.data['mesh']['ijk_axis']
+            ai_i = np.tile(np.repeat(ai_i_axis, ai_k_axis.shape[0]), ai_j_axis.shape[0])
+            ai_j = np.repeat(ai_j_axis, ai_i_axis.shape[0] * ai_k_axis.shape[0])
+            ai_k = np.tile(ai_k_axis, ai_j_axis.shape[0] * ai_i_axis.shape[0])
+
+            # handle coordinates
+            do_column = {
+                'voxel_i': ai_i, 'voxel_j': ai_j, 'voxel_k': ai_k,
+                'mesh_center_m': ar_m, 'mesh_center_n': ar_n, 'mesh_center_p': ar_p,
+            }
+
+            # handle concentrations
+            for s_substrate in self.get_substrate_names():
+                do_column[s_substrate] = self.data['continuum_variables'][s_substrate]['data'].ravel(order='C')
+
+            # handle time
+            do_column['time'] = self.get_time()
+            do_column['runtime'] = self.get_runtime() / 60  # in min
+            do_column['xmlfile'] = self.xmlfile
+
+            # generate dataframe
+            df_conc = pd.DataFrame(do_column, copy=False)
+            if self.cache:
+                self.data['cache']['df_conc'] = df_conc
+
+        # output
+        return df_conc
+
+
+    def get_conc_df(self, z_slice=None, halt=False, values=1, drop=set(), keep=set(), dtype=np.float64):
         """
         input:
             z_slice: floating point number; default is None
@@ -823,6 +1351,10 @@ class pyMCDS:
                 don't worry: essential columns like ID, coordinates
                 and time will always be kept.
 
+            dtype: numpy floating point data type; default is np.float64
+                data type for the substrate concentration columns.
+                np.float32 halves the memory footprint of these columns.
+
         output:
             df_conc : pandas dataframe
                 dataframe stores all substrate concentrations in each voxel.
@@ -844,48 +1376,18 @@ class pyMCDS:
                 if halt:
                     sys.exit('Processing stopped!')
                 else:
-                    z_slice = ar_p_axis[abs(ar_p_axis - z_slice).argmin()]
+                    z_slice = _snap_to_axis(ar_p_axis, z_slice)
                     print(f'z_slice set to {z_slice}.')
 
-        # flatten mesh coordnates
-        ar_m, ar_n, ar_p = self.get_mesh()
-        ar_m = ar_m.flatten(order='C')
-        ar_n = ar_n.flatten(order='C')
-        ar_p = ar_p.flatten(order='C')
-
-        # get mesh spacing
-        dm, dn, dp = self.get_voxel_spacing()
-
-        # get voxel coordinates
-        ai_i = ((ar_m - ar_m.min()) / dm)
-        ai_j = ((ar_n - ar_n.min()) / dn)
-        ai_k = ((ar_p - ar_p.min()) / dp)
-
-        # handle coordinates
-        ls_column = [
-            'voxel_i','voxel_j','voxel_k',
-            'mesh_center_m','mesh_center_n','mesh_center_p'
-        ]
-        la_data = [ai_i, ai_j, ai_k, ar_m, ar_n, ar_p]
-
-        # handle concentrations
-        for s_substrate in self.get_substrate_names():
-            ls_column.append(s_substrate)
-            ar_conc = self.get_concentration(substrate=s_substrate, z_slice=None)
-            la_data.append(ar_conc.flatten(order='C'))
+        # get the full dataframe, filters below always return a new dataframe
+        df_conc = self._get_conc_df_cache()
+        if (np.dtype(dtype) != np.float64):
+            df_conc = df_conc.astype({s_substrate: dtype for s_substrate in self.get_substrate_names()})
 
-        # generate dataframe
-        aa_data  = np.array(la_data)
-        df_conc = pd.DataFrame(aa_data.T, columns=ls_column)
-        df_conc['time'] = self.get_time()
-        df_conc['runtime'] = self.get_runtime() / 60  # in min
-        df_conc['xmlfile'] = self.xmlfile
-        d_dtype = {'voxel_i': int, 'voxel_j': int, 'voxel_k': int}
-        df_conc = df_conc.astype(d_dtype)
-
-        # filter z_slice
+        # filter z_slice, rows are flattened from the [j,i,k] meshgrid, so k runs fastest
         if not (z_slice is None):
-           df_conc = df_conc.loc[df_conc.mesh_center_p == z_slice, :]
+           k = np.where(ar_p_axis == z_slice)[0][0]
+           df_conc = df_conc.take(np.arange(k, df_conc.shape[0], ar_p_axis.shape[0]))
 
         # filter
         es_feature = set(df_conc.columns).difference(es_coor_conc)
@@ -895,15 +1397,15 @@ class pyMCDS:
             es_delete = es_feature.intersection(drop)
 
         if (values > 1):
-            for s_column in set(df_conc.columns).difference(es_coor_conc):
-                if len(set(df_conc.loc[:,s_column])) < values:
+            for s_column in es_feature.difference(es_delete):
+                if (df_conc.loc[:,s_column].nunique(dropna=False) < values):
                     es_delete.add(s_column)
         if self.verbose and (len(es_delete) > 0):
             print('es_delete:', es_delete)
-        df_conc.drop(es_delete, axis=1, inplace=True)
+        df_conc = df_conc.loc[:,[s_column for s_column in df_conc.columns if not (s_column in es_delete)]]
 
         # output
-        df_conc.sort_values(['voxel_i', 'voxel_j', 'voxel_k', 'time'], inplace=True)
+        df_conc = df_conc.sort_values(['voxel_i', 'voxel_j', 'voxel_k', 'time'])
         return df_conc
 
 
@@ -977,38 +1479,28 @@ class pyMCDS:
         # handle z_slice input
         _, _, ar_p_axis = self.get_mesh_mnp_axis()
         if not (z_slice in ar_p_axis):
-            z_slice = ar_p_axis[abs(ar_p_axis - z_slice).argmin()]
+            z_slice = _snap_to_axis(ar_p_axis, z_slice)
             if self.verbose:
                 print(f'z_slice set to {z_slice}.')
 
-        # get data z slice
-        df_conc = self.get_conc_df(values=1, drop=set(), keep=set())
-        df_conc = df_conc.loc[(df_conc.mesh_center_p == z_slice),:]
+        # get data z slice as m, n-grid
+        ar_m_axis, ar_n_axis, _ = self.get_mesh_mnp_axis()
+        k = np.where(ar_p_axis == z_slice)[0][0]
+        ar_conc = self.data['continuum_variables'][substrate]['data'][:,:,k].T
         # extend to x y domain border
-        df_mmin = df_conc.loc[(df_conc.mesh_center_m == df_conc.mesh_center_m.min()), :].copy()
-        df_mmin.mesh_center_m = self.get_xyz_range()[0][0]
-        df_mmax = df_conc.loc[(df_conc.mesh_center_m == df_conc.mesh_center_m.max()), :].copy()
-        df_mmax.mesh_center_m = self.get_xyz_range()[0][1]
-        df_conc = pd.concat([df_conc, df_mmin, df_mmax], axis=0)
-        df_nmin = df_conc.loc[(df_conc.mesh_center_n == df_conc.mesh_center_n.min()), :].copy()
-        df_nmin.mesh_center_n =self.get_xyz_range()[1][0]
-        df_nmax = df_conc.loc[(df_conc.mesh_center_n == df_conc.mesh_center_n.max()), :].copy()
-        df_nmax.mesh_center_n = self.get_xyz_range()[1][1]
-        df_conc = pd.concat([df_conc, df_nmin, df_nmax], axis=0)
-        # sort dataframe
-        df_conc.sort_values(['mesh_center_m', 'mesh_center_n', 'mesh_center_p'], inplace=True)
-
-        # meshgrid shape
-        ti_shape = (self.get_voxel_ijk_axis()[0].shape[0]+2, self.get_voxel_ijk_axis()[1].shape[0]+2)
-        x = (df_conc.loc[:,'mesh_center_m'].values).reshape(ti_shape)
-        y = (df_conc.loc[:,'mesh_center_n'].values).reshape(ti_shape)
-        z = (df_conc.loc[:,substrate].values).reshape(ti_shape)
+        tr_x, tr_y, _ = self.get_xyz_range()
+        ar_m_axis = np.concatenate([[tr_x[0]], ar_m_axis, [tr_x[1]]])
+        ar_n_axis = np.concatenate([[tr_y[0]], ar_n_axis, [tr_y[1]]])
+        z = np.pad(ar_conc, pad_width=1, mode='edge')
+
+        # meshgrid
+        x, y = np.meshgrid(ar_m_axis, ar_n_axis, indexing='ij')
 
         # handle vmin and vmax input
         if (vmin is None):
-            vmin = np.floor(df_conc.loc[:,substrate].min())
+            vmin = np.floor(z.min())
         if (vmax is None):
-            vmax = np.ceil(df_conc.loc[:,substrate].max())
+            vmax = np.ceil(z.max())
 
         # get figure and axis orbject
         if (ax is None):
@@ -1066,36 +1558,21 @@ class pyMCDS:
             substrates over microenvironment. You can post-process this file
             in other software like Paraview.
         """
-        # Get microenviornment data frame
-        df_micenv = self.get_conc_df()
+        # load vtk only when needed, it is a heavy library
+        import vtk
+        from vtk.util import numpy_support
 
         # Create a rectilinear grid
         vr_grid = vtk.vtkRectilinearGrid()
 
-        # Define dimensions of the grid
-        t_dims = (len(pd.unique(df_micenv['voxel_i'])), len(pd.unique(df_micenv['voxel_j'])), len(pd.unique(df_micenv['voxel_k'])))
-
         # Define coordinates for the grid
-        vf_x = vtk.vtkFloatArray()
-        vf_y = vtk.vtkFloatArray()
-        vf_z = vtk.vtkFloatArray()
-
-        # Assign coordinates for the grid
-        vf_x.SetNumberOfTuples(t_dims[0])
-        vf_y.SetNumberOfTuples(t_dims[1])
-        vf_z.SetNumberOfTuples(t_dims[2])
-
-        # Populate the coordinates
-        for i in range(t_dims[0]):
-            vf_x.SetValue(i, pd.unique(df_micenv['mesh_center_m'])[i])
-
-        for j in range(t_dims[1]):
-            vf_y.SetValue(j, pd.unique(df_micenv['mesh_center_n'])[j])
-
-        for k in range(t_dims[2]):
-            vf_z.SetValue(k, pd.unique(df_micenv['mesh_center_p'])[k])
+        ar_m_axis, ar_n_axis, ar_p_axis = self.get_mesh_mnp_axis()
+        vf_x = numpy_support.numpy_to_vtk(np.ascontiguousarray(ar_m_axis, dtype=np.float32), deep=1, array_type=vtk.VTK_FLOAT)
+        vf_y = numpy_support.numpy_to_vtk(np.ascontiguousarray(ar_n_axis, dtype=np.float32), deep=1, array_type=vtk.VTK_FLOAT)
+        vf_z = numpy_support.numpy_to_vtk(np.ascontiguousarray(ar_p_axis, dtype=np.float32), deep=1, array_type=vtk.VTK_FLOAT)
 
         # Grid dimensions
+        t_dims = (ar_m_axis.shape[0], ar_n_axis.shape[0], ar_p_axis.shape[0])
         vr_grid.SetDimensions(t_dims)
         vr_grid.SetXCoordinates(vf_x)
         vr_grid.SetYCoordinates(vf_y)
@@ -1104,19 +1581,22 @@ class pyMCDS:
         # Learn substrate names
         l_substrate_names = self.get_substrate_names()
 
-        # For loop to fill rectilinear grid
-        for name_index, name in enumerate(l_substrate_names):
-            vf_values = vtk.vtkFloatArray()
-            vf_values.SetNumberOfComponents(1)
-            vf_values.SetNumberOfTuples(t_dims[0] * t_dims[1] * t_dims[2])
+        # meshgrid is indexed [j,i,k], vtk expects i fastest, then j, then k.
+        # numpy releases the gil while copying, so the substrates can be prepared in parallel.
+        def _vtk_order(s_substrate):
+            ar_values = self.data['continuum_variables'][s_substrate]['data'].transpose(2,0,1)
+            return np.ascontiguousarray(ar_values, dtype=np.float32).ravel()
+
+        if (len(l_substrate_names) > 1):
+            with ThreadPoolExecutor() as o_executor:
+                lar_values = list(o_executor.map(_vtk_order, l_substrate_names))
+        else:
+            lar_values = [_vtk_order(s_substrate) for s_substrate in l_substrate_names]
+
+        # For loop to fill rectilinear grid, vtk objects are only touched from this thread
+        for name_index, (name, ar_values) in enumerate(zip(l_substrate_names, lar_values)):
+            vf_values = numpy_support.numpy_to_vtk(ar_values, deep=1, array_type=vtk.VTK_FLOAT)
             vf_values.SetName(name)  # Set the name of the array
-            # Populate the substrate values
-            for k in range(t_dims[2]):
-                for j in range(t_dims[1]):
-                    for i in range(t_dims[0]):
-                        idx = i + t_dims[0] * (j + t_dims[1] * k)
-                        conc_at_specific_position = df_micenv[name][idx]
-                        vf_values.SetValue(idx, conc_at_specific_position)
             if name_index == 0:
                 vr_grid.GetPointData().SetScalars(vf_values)
             else:
@@ -1128,6 +1608,9 @@ class pyMCDS:
         s_vtkpathfile = self.path + '/' + self.xmlfile.replace('.xml','_conc.vtk')
         vw_writer = vtk.vtkXMLRectilinearGridWriter()
         vw_writer.SetFileName(s_vtkpathfile)
+        vw_writer.SetDataModeToAppended()  # raw binary, zlib compressed
+        vw_writer.SetEncodeAppendedData(False)
+        vw_writer.SetCompressorTypeToZLib()
         vw_writer.SetInputData(vr_grid)
         vw_writer.Write()
         return s_vtkpathfile
@@ -1202,118 +1685,109 @@ class pyMCDS:
         if (len(keep) > 0) and (len(drop) > 0):
             sys.exit(f"Error @ pyMCDS.get_cell_df : when keep is given {keep}, then drop has to be an empty set {drop}!")
 
-        # get cell position and more
-        df_cell = pd.DataFrame(self.data['discrete_cells']['data'])
-        df_cell['time'] = self.get_time()
-        df_cell['runtime'] = self.get_runtime() / 60  # in min
-        df_cell['xmlfile'] = self.xmlfile
-        df_voxel = df_cell.loc[:,['position_x','position_y','position_z']].copy()
-
-        # get mesh spacing
-        dm, dn, dp = self.get_voxel_spacing()
-
-        # get mesh and voxel min max values
-        tr_m_range, tr_n_range, tr_p_range = self.get_mesh_mnp_range()
-        tr_i_range, tr_j_range, tr_k_range = self.get_voxel_ijk_range()
-
-        # get voxel for each cell
-        df_voxel.loc[:,'voxel_i'] = np.round((df_voxel.loc[:,'position_x'] - tr_m_range[0]) / dm).astype(int)
-        df_voxel.loc[:,'voxel_j'] = np.round((df_voxel.loc[:,'position_y'] - tr_n_range[0]) / dn).astype(int)
-        df_voxel.loc[:,'voxel_k'] = np.round((df_voxel.loc[:,'position_z'] - tr_p_range[0]) / dp).astype(int)
-        df_voxel.loc[(df_voxel.voxel_i > tr_i_range[1]), 'voxel_i'] = tr_i_range[1]  # i_max
-        df_voxel.loc[(df_voxel.voxel_i < tr_i_range[0]), 'voxel_i'] = tr_i_range[0]  # i_min
-        df_voxel.loc[(df_voxel.voxel_j > tr_j_range[1]), 'voxel_j'] = tr_j_range[1]  # j_max
-        df_voxel.loc[(df_voxel.voxel_j < tr_j_range[0]), 'voxel_j'] = tr_j_range[0]  # j_min
-        df_voxel.loc[(df_voxel.voxel_k > tr_k_range[1]), 'voxel_k'] = tr_k_range[1]  # k_max
-        df_voxel.loc[(df_voxel.voxel_k < tr_k_range[0]), 'voxel_k'] = tr_k_range[0]  # k_min
-
-        # merge voxel (inner join)
-        df_cell = pd.merge(df_cell, df_voxel, on=['position_x', 'position_y', 'position_z'])
-
-        # merge cell_density (left join)
-        df_cellcount = df_cell.loc[:,['voxel_i','voxel_j','voxel_k','ID']].groupby(['voxel_i','voxel_j','voxel_k']).count().reset_index()
-        ls_column = list(df_cellcount.columns)
-        ls_column[-1] = 'cell_count_voxel'
-        df_cellcount.columns = ls_column
-        s_density = f"cell_density_{self.data['metadata']['spatial_units']}3"
-        df_cellcount[s_density] = df_cellcount.loc[:,'cell_count_voxel'] / self.get_voxel_volume()
-        df_cell = pd.merge(
-            df_cell,
-            df_cellcount,
-            on = ['voxel_i', 'voxel_j', 'voxel_k'],
-            how = 'left',
-        )
+        # build the full dataframe, if not cached, filters below always return a new dataframe
+        df_cell = self.data['cache']['df_cell']
+        if (df_cell is None):
+            # get cell position and more
+            df_cell = pd.DataFrame(self.data['discrete_cells']['data'])
+            df_cell['time'] = self.get_time()
+            df_cell['runtime'] = self.get_runtime() / 60  # in min
+            df_cell['xmlfile'] = self.xmlfile
+
+            # get voxel for each cell, clipped to the mesh, as numpy arrays
+            ar_position = df_cell.loc[:,['position_x','position_y','position_z']].to_numpy()
+            ai_ijk, _ = self.get_voxel_ijk_batch(
+                x = ar_position[:,0],
+                y = ar_position[:,1],
+                z = ar_position[:,2],
+                is_in_mesh = False,
+            )
+            ai_ijk = ai_ijk.astype(self.data['mesh']['ijk_dtype'])
+
+            # attach voxel (same row order as df_cell, no join needed)
+            df_cell['voxel_i'] = ai_ijk[:,0]
+            df_cell['voxel_j'] = ai_ijk[:,1]
+            df_cell['voxel_k'] = ai_ijk[:,2]
+
+            # get cell_density (linearized voxel key counts, no groupby and merge)
+            i_m = len(self.data['mesh']['mnp_axis'][0])
+            i_n = len(self.data['mesh']['mnp_axis'][1])
+            ai_key = ai_ijk[:,0].astype(np.int64) + i_m * ai_ijk[:,1].astype(np.int64) + i_m * i_n * ai_ijk[:,2].astype(np.int64)
+            _, ai_inverse, ai_count = np.unique(ai_key, return_inverse=True, return_counts=True)
+            s_density = f"cell_density_{self.data['metadata']['spatial_units']}3"
+            df_cell['cell_count_voxel'] = ai_count[ai_inverse]
+            df_cell[s_density] = df_cell.loc[:,'cell_count_voxel'] / self.get_voxel_volume()
+
+            # get column label set
+            es_column = set(df_cell.columns)
+
+            # get vector length
+            for s_var_spatial in es_var_spatial:
+                ls_vector = [f'{s_var_spatial}_{s_axis}' for s_axis in ('x','y','z') if f'{s_var_spatial}_{s_axis}' in es_column]
+                if len(ls_vector) > 0:
+                    df_cell[f'{s_var_spatial}_vectorlength'] = np.linalg.norm(df_cell.loc[:,ls_vector].to_numpy(), axis=1)
+
+            # physicell
+            if not (self.data['discrete_cells']['physiboss'] is None):
+                df_cell = pd.merge(
+                    df_cell,
+                    self.data['discrete_cells']['physiboss'],
+                    left_index = True,
+                    right_index = True,
+                    how = 'left',
+                )
 
-        # get column label set
-        es_column = set(df_cell.columns)
-
-        # get vector length
-        for s_var_spatial in es_var_spatial:
-            es_vector = es_column.intersection({f'{s_var_spatial}_x',f'{s_var_spatial}_y',f'{s_var_spatial}_z'})
-            if len(es_vector) > 0:
-                # linear algebra
-                #a_vector = df_cell.loc[:,ls_vector].values
-                #a_length = np.sqrt(np.diag(np.dot(a_vector, a_vector.T)))
-                # pythoagoras
-                a_length = None
-                for s_vector in es_vector:
-                    a_vectorsq = df_cell.loc[:,s_vector].values**2
-                    if (a_length is None):
-                        a_length = a_vectorsq
-                    else:
-                        a_length += a_vectorsq
-                a_length = a_length**(1/2)
-                # result
-                df_cell[f'{s_var_spatial}_vectorlength'] = a_length
 
-        # physicell
-        if not (self.data['discrete_cells']['physiboss'] is None):
+            # microenvironment
+            if self.microenv:
+                # merge substrate (left join)
+                df_sub = self.get_substrate_df()
+                do_sub = {}
+                for s_sub in df_sub.index:
+                     for s_rate in df_sub.columns:
+                         do_sub.update({f'{s_sub}_{s_rate}': np.full(df_cell.shape[0], df_sub.loc[s_sub,s_rate])})
+                df_cell = pd.concat([df_cell, pd.DataFrame(do_sub, index=df_cell.index)], axis=1)
+
+            # merge concentration (left join)
+            df_conc = self._get_conc_df_cache()
             df_cell = pd.merge(
                 df_cell,
-                self.data['discrete_cells']['physiboss'],
-                left_index = True,
-                right_index = True,
+                df_conc.drop(columns=['time', 'runtime', 'xmlfile']),
+                on = ['voxel_i', 'voxel_j', 'voxel_k'],
                 how = 'left',
             )
 
-
-        # microenvironment
-        if self.microenv:
-            # merge substrate (left join)
-            df_sub = self.get_substrate_df()
-            for s_sub in df_sub.index:
-                 for s_rate in df_sub.columns:
-                     s_var = f'{s_sub}_{s_rate}'
-                     df_cell[s_var] = df_sub.loc[s_sub,s_rate]
-
-        # merge concentration (left join)
-        df_conc = self.get_conc_df(z_slice=None, values=1, drop=set(), keep=set())
-        df_conc.drop({'time', 'runtime','xmlfile'}, axis=1, inplace=True)
-        df_cell = pd.merge(
-            df_cell,
-            df_conc,
-            on = ['voxel_i', 'voxel_j', 'voxel_k'],
-            how = 'left',
-        )
-
-        # variable typing
-        do_type = {}
-        [do_type.update({k:v}) for k,v in do_var_type.items() if k in es_column]
-        do_type.update(self.custom_type)
-        do_int = do_type.copy()
-        [do_int.update({k:int}) for k in do_int.keys()]
-        ls_int = sorted(do_int.keys())
-        df_cell.loc[:,ls_int] = df_cell.loc[:,ls_int].round()
-        df_cell = df_cell.astype(do_int)
-        df_cell = df_cell.astype(do_type)
-
-        # categorical translation
-        df_cell.loc[:,'current_death_model'] = df_cell.loc[:,'current_death_model'].replace(ds_death_model)  # bue 20230614: this column looks like an artefact to me
-        df_cell.loc[:,'cycle_model'] = df_cell.loc[:,'cycle_model'].replace(ds_cycle_model)
-        df_cell.loc[:,'cycle_model'] = df_cell.loc[:,'cycle_model'].replace(ds_death_model)
-        df_cell.loc[:,'current_phase'] = df_cell.loc[:,'current_phase'].replace(ds_cycle_phase)
-        df_cell.loc[:,'current_phase'] = df_cell.loc[:,'current_phase'].replace(ds_death_phase)
-        df_cell.loc[:,'cell_type'] = df_cell.loc[:,'cell_type'].replace(self.data['metadata']['cell_type'])
+            # variable typing
+            do_type = {}
+            [do_type.update({k:v}) for k,v in do_var_type.items() if k in es_column]
+            do_type.update(self.custom_type)
+            # integer code cast: round float columns only, one allocation per column
+            do_int = {}
+            for s_column in sorted(do_type.keys()):
+                ar_value = df_cell[s_column].to_numpy()
+                if (ar_value.dtype.kind == 'f'):
+                    ar_value = np.rint(ar_value)
+                do_int.update({s_column: ar_value.astype(int, copy=False)})
+            df_cell = df_cell.assign(**do_int)
+
+            # categorical translation of integer codes
+            # bue 20230614: the current_death_model column looks like an artefact to me
+            for s_column, ds_codec in [
+                    ('current_death_model', ds_death_model),
+                    ('cycle_model', {**ds_death_model, **ds_cycle_model}),
+                    ('current_phase', {**ds_death_phase, **ds_cycle_phase}),
+                ]:
+                se_code = df_cell.loc[:,s_column]
+                se_label = se_code.map(ds_codec)
+                df_cell[s_column] = np.where(se_label.isna(), se_code.to_numpy(dtype=object), se_label.to_numpy(dtype=object))
+            df_cell = df_cell.astype({s_column: o_type for s_column, o_type in do_type.items() if not (o_type is int)})
+
+            # categorical translation
+            se_code = df_cell.loc[:,'cell_type']
+            se_label = se_code.map(self.data['metadata']['cell_type'])
+            df_cell['cell_type'] = np.where(se_label.isna(), se_code.to_numpy(dtype=object), se_label.to_numpy(dtype=object))
+            if self.cache:
+                self.data['cache']['df_cell'] = df_cell
 
         # filter
         es_feature = set(df_cell.columns).difference(es_coor_cell)
@@ -1323,17 +1797,17 @@ class pyMCDS:
             es_delete = es_feature.intersection(drop)
 
         if (values > 1):  # by minimal number of states
-            for s_column in set(df_cell.columns).difference(es_coor_cell):
-                if len(set(df_cell.loc[:,s_column])) < values:
+            for s_column in es_feature.difference(es_delete):
+                if (df_cell.loc[:,s_column].nunique(dropna=False) < values):
                     es_delete.add(s_column)
         if self.verbose and (len(es_delete) > 0):
             print('es_delete:', es_delete)
-        df_cell.drop(es_delete, axis=1, inplace=True)
 
         # output
-        df_cell = df_cell.loc[:,sorted(df_cell.columns)]
+        ai_column = np.argsort(df_cell.columns.values.astype(str), kind='stable')
+        ai_column = ai_column[~df_cell.columns[ai_column].isin(es_delete)]
+        df_cell = df_cell.iloc[:,ai_column].copy()
         df_cell.set_index('ID', inplace=True)
-        df_cell = df_cell.copy()
         return df_cell
 
 
@@ -1381,15 +1855,15 @@ class pyMCDS:
         b_calc = self.is_in_mesh(x=x, y=y, z=z, halt=False)
         if b_calc:
 
-            # get mesh and mesh spacing
+            # get mesh axis and mesh spacing
             dm, dn, dp = self.get_voxel_spacing()
-            ar_m, ar_n, ar_p = self.get_mesh()
+            ar_m_axis, ar_n_axis, ar_p_axis = self.data['mesh']['mnp_axis']
 
             # get voxel coordinate
             i, j, k = self.get_voxel_ijk(x, y, z, is_in_mesh=False)
-            m = ar_m[j, i, k]
-            n = ar_n[j, i, k]
-            p = ar_p[j, i, k]
+            m = ar_m_axis[i]
+            n = ar_n_axis[j]
+            p = ar_p_axis[k]
 
             # get voxel
             df_cell = self.get_cell_df(values=values, drop=drop, keep=keep)
@@ -1463,8 +1937,9 @@ class pyMCDS:
                 typographic points are 1/72 inch.
                 the marker size s is specified in points**2.
                 plt.rcParams['lines.markersize']**2 is in my case 36.
-                None tries to take the value from the initial.svg file.
-                fall back setting is 36.
+                None results in the pandas plot scatter default, which is 20.
+                unlike TimeSeries.plot_scatter, this function does not
+                read the initial.svg file.
 
             figsize: tuple of floating point numbers; default is None
                 the specif the figure x and y measurement in inch.
@@ -1476,13 +1951,14 @@ class pyMCDS:
                 or color legend (categorical data).
 
         description:
-            function returns a (pandas) matplotlib scatter plot,
-            inclusive color bar, for the substrate specified.
+            function returns a matplotlib figure, with the cells for the
+            focus variable specified drawn by ax.scatter on the ax axis
+            object, inclusive color bar or color legend.
         """
         # handle z_slice
         _, _, ar_p_axis = self.get_mesh_mnp_axis()
         if not (z_slice in ar_p_axis):
-            z_slice = ar_p_axis[abs(ar_p_axis - z_slice).argmin()]
+            z_slice = _snap_to_axis(ar_p_axis, z_slice)
             if self.verbose:
                 print(f'z_slice set to {z_slice}.')
 
@@ -1491,12 +1967,12 @@ class pyMCDS:
         df_cell = df_cell.loc[(df_cell.mesh_center_p == z_slice),:]
 
         # handle z_axis categorical cases
-        if (str(df_cell.loc[:,focus].dtype) in {'bool', 'object'}):
+        if pdt.is_bool_dtype(df_cell.loc[:,focus]) or pdt.is_object_dtype(df_cell.loc[:,focus]):
             lr_extrema = [None, None]
             if (z_axis is None):
                 # extract set of labels from data
                 es_category = set(df_cell.loc[:,focus])
-                if (str(df_cell.loc[:,focus].dtype) in {'bool'}):
+                if pdt.is_bool_dtype(df_cell.loc[:,focus]):
                     es_category = es_category.union({True, False})
             else:
                 es_category = z_axis
@@ -1542,49 +2018,55 @@ class pyMCDS:
 
         # handle categorical variable
         if not (es_category is None):
-            s_focus_color = focus + '_color'
+            # the color list is generated aside, not as column in the wide df_cell,
+            # which would fragment the dataframe.
             # use specified category color dictionary
             if type(cmap) is dict:
                 ds_color = cmap
-                df_cell[s_focus_color] = 'gray'
-                for s_category, s_color in ds_color.items():
-                    df_cell.loc[(df_cell.loc[:,focus] == s_category), s_focus_color] = s_color
+                c = df_cell.loc[:,focus].astype(object).map(ds_color).fillna('gray').to_numpy()
             # generate category color dictionary
             else:
+                df_focus = df_cell.loc[:,[focus]].copy()
                 ds_color = pdplt.df_label_to_color(
-                    df_abc = df_cell,
+                    df_abc = df_focus,
                     s_focus = focus,
                     es_label = es_category,
                     s_nolabel = 'gray',
                     s_cmap = cmap,
                     b_shuffle = False,
                 )
-            # generate color list
-            c = list(df_cell.loc[:, s_focus_color].values)
+                c = df_focus.loc[:, focus + '_color'].to_numpy()
             s_cmap = None
 
         # handle numeric variable
         else:
-            c = focus
+            c = df_cell.loc[:,focus].to_numpy()
             s_cmap = cmap
 
-        # plot scatter
-        df_cell.plot(
-            kind = 'scatter',
-            x = 'position_x',
-            y = 'position_y',
+        # handle marker size, pandas plot scatter default
+        if (s is None):
+            s = 20
+
+        # plot scatter, straight into matplotlib without DataFrame.plot
+        o_scatter = ax.scatter(
+            df_cell.loc[:,'position_x'].to_numpy(),
+            df_cell.loc[:,'position_y'].to_numpy(),
             c = c,
+            cmap = s_cmap,
+            s = s,
             vmin = lr_extrema[0],
             vmax = lr_extrema[1],
             alpha = alpha,
-            cmap = s_cmap,
-            title = title,
-            xlim = xlim,
-            ylim = ylim,
-            s = s,
-            grid = grid,
-            ax = ax,
         )
+        if (es_category is None):
+            fig.colorbar(o_scatter, ax=ax, label=focus)
+        ax.set_ylim(ylim)
+        ax.set_xlim(xlim)
+        ax.grid(grid)
+        if title:
+            ax.set_title(title)
+        ax.set_xlabel('position_x')
+        ax.set_ylabel('position_y')
 
         # plot categorical data legen
         if not (es_category is None):
@@ -1599,7 +2081,7 @@ class pyMCDS:
         return fig
 
 
-    def make_cell_vtk(self, l_attributes=['cell_type'], visualize='True'):
+    def make_cell_vtk(self, l_attributes=['cell_type'], visualize='True', glyph_mapper=False):
         """
         input:
 
@@ -1609,8 +2091,17 @@ class pyMCDS:
             visualize: boolean; default is True
                 visualize cells using vtk Renderer.
 
+            glyph_mapper: boolean; default is False
+                if True, the sphere glyphs are not materialized.
+                instead, the cell center points, with radius and attributes,
+                are saved as unstructured grid vtu file,
+                and rendered with a vtkGlyph3DMapper.
+                in Paraview, apply the Glyph filter (sphere, scale by radius)
+                to get the spheres back.
+
         output:
             vtk: 3D Glyph VTK that contains cells.
+                or with glyph_mapper True, a VTU file with cell center points.
 
 
         description:
@@ -1618,31 +2109,29 @@ class pyMCDS:
             specificed attributes like 'cell_type', 'pressure', 'dead', etc.
             You can post-process this file in other software like Paraview.
         """
+        # load vtk only when needed, it is a heavy library
+        import vtk
+        from vtk.util import numpy_support
+
         # Get cell data frame
         df_cell = self.get_cell_df(values=1, drop=set(), keep=set())
         df_cell = df_cell.reset_index()
 
-        # Get positions and radii
-        se_x_pos = df_cell['position_x']
-        se_y_pos = df_cell['position_y']
-        se_z_pos = df_cell['position_z']
-        se_radius =  df_cell['radius']
+        # Get positions and radii as contiguous float32 arrays
+        ar_xyz = np.ascontiguousarray(df_cell.loc[:,['position_x','position_y','position_z']].to_numpy(dtype=np.float32))
+        ar_radius = np.ascontiguousarray(df_cell['radius'].to_numpy(dtype=np.float32))
 
-        # Create VTK instances to fill for positions and radii
-        vp_points = vtkPoints()
-        vf_radii = vtk.vtkFloatArray()
+        # Fill VTK instances with positions and radii in one bulk copy
+        vp_points = vtk.vtkPoints()
+        vp_points.SetData(numpy_support.numpy_to_vtk(ar_xyz, deep=1, array_type=vtk.VTK_FLOAT))
+        vf_radii = numpy_support.numpy_to_vtk(ar_radius, deep=1, array_type=vtk.VTK_FLOAT)
         vf_radii.SetName("radius")
 
-        # Fill VTK instance with positions and radii
-        for i in range(len(se_x_pos)):
-            vp_points.InsertNextPoint(se_x_pos[i], se_y_pos[i], se_z_pos[i])
-            vf_radii.InsertNextValue(se_radius[i])
-
 
         # Create Data Instances
         vf_data = vtk.vtkFloatArray()
         vf_data.SetNumberOfComponents(2)
-        vf_data.SetNumberOfTuples(len(se_x_pos))
+        vf_data.SetNumberOfTuples(ar_radius.shape[0])
         vf_data.CopyComponent(0, vf_radii, 0)
         vf_data.SetName("positions_and_radii")
 
@@ -1652,27 +2141,35 @@ class pyMCDS:
         vu_grid.GetPointData().AddArray(vf_data)
         vu_grid.GetPointData().SetActiveScalars("positions_and_radii")
 
+        # vtk array builders, dispatched by numpy dtype kind
+        def vtk_string(ls_value):
+            custom_data_vtk = vtk.vtkStringArray()
+            custom_data_vtk.SetNumberOfValues(len(ls_value))
+            for i, s_value in enumerate(ls_value):
+                custom_data_vtk.SetValue(i, s_value)
+            return custom_data_vtk
+
+        def vtk_float(se_value):  # numeric as float, one bulk copy
+            return numpy_support.numpy_to_vtk(np.ascontiguousarray(se_value.to_numpy(dtype=np.float32)), deep=1, array_type=vtk.VTK_FLOAT)
+
+        do_vtk_array = {
+            'b': lambda se_value: vtk_string(np.where(se_value.to_numpy(), 'True', 'False').tolist()),  # bool as string
+            'i': vtk_float,
+            'u': vtk_float,
+            'f': vtk_float,
+            'O': lambda se_value: vtk_string(se_value.astype(str).tolist()),  # str as string
+            'U': lambda se_value: vtk_string(se_value.astype(str).tolist()),
+            'S': lambda se_value: vtk_string(se_value.astype(str).tolist()),
+        }
+
         # Fill This grid with given attributes
         for name_index, name in enumerate(l_attributes):
             custom_data_i = df_cell[name]
-            if (type(custom_data_i[0]) in {str, np.str_}):
-                custom_data_vtk = vtk.vtkStringArray()
-                custom_data_vtk.SetName(name)
-            elif(type(custom_data_i[0]) in {float, np.float_, np.float16, np.float32, np.float64, int}):
-                custom_data_vtk = vtk.vtkFloatArray()
-                custom_data_vtk.SetName(name)
-            elif (type(custom_data_i[0]) in {bool, np.bool_}):
-                custom_data_vtk =vtk.vtkStringArray()
-                custom_data_vtk.SetName(name)
-
-            for i in range(len(custom_data_i)):
-                if (type(custom_data_i[0]) in {bool, np.bool_}):
-                    if (custom_data_i[i] == True):
-                        custom_data_vtk.InsertNextValue('True')
-                    else:
-                        custom_data_vtk.InsertNextValue('False')
-                else:
-                    custom_data_vtk.InsertNextValue(custom_data_i[i])
+            o_vtk_array = do_vtk_array.get(custom_data_i.dtype.kind)
+            if (o_vtk_array is None):
+                sys.exit(f'Error @ make_cell_vtk : attribute {name}; dtype {custom_data_i.dtype}; dtype seems not to be bool, int, float, or string.')
+            custom_data_vtk = o_vtk_array(custom_data_i)
+            custom_data_vtk.SetName(name)
 
             vu_grid.GetPointData().AddArray(custom_data_vtk)
             del custom_data_vtk
@@ -1684,33 +2181,69 @@ class pyMCDS:
         vsp_sphere.SetPhiResolution(16)
         vsp_sphere.SetThetaResolution(32)
 
-        # Create Glyph to save
-        vg_glyph = vtk.vtkGlyph3D()
-        vg_glyph.SetInputData(vu_grid)
-        vg_glyph.SetSourceConnection(vsp_sphere.GetOutputPort())
-
-        # Define important preferences for VTK
-        vg_glyph.ClampingOff()
-        vg_glyph.SetScaleModeToScaleByScalar()
-        vg_glyph.SetScaleFactor(1.0)
-        vg_glyph.SetColorModeToColorByScalar()
-        vg_glyph.Update()
-
-        # Write VTK
-        s_vtkpathfile = self.path + '/' + self.xmlfile.replace('.xml','_cells.vtk')
-        vw_writer = vtk.vtkXMLPolyDataWriter()
-        vw_writer.SetFileName(s_vtkpathfile)
-        vw_writer.SetInputData(vg_glyph.GetOutput())
-        vw_writer.Write()
+        if (glyph_mapper):
+            # Add radius and one vertex cell per point, to keep the points visible
+            vu_grid.GetPointData().AddArray(vf_radii)
+            i_cell = ar_radius.shape[0]
+            o_idtype = numpy_support.get_vtk_to_numpy_typemap()[vtk.VTK_ID_TYPE]
+            vc_vertex = vtk.vtkCellArray()
+            vc_vertex.SetData(
+                numpy_support.numpy_to_vtkIdTypeArray(np.arange(i_cell + 1, dtype=o_idtype), deep=1),  # offsets
+                numpy_support.numpy_to_vtkIdTypeArray(np.arange(i_cell, dtype=o_idtype), deep=1),  # connectivity
+            )
+            vu_grid.SetCells(vtk.VTK_VERTEX, vc_vertex)
+
+            # Write VTU, the glyphs are not materialized
+            s_vtkpathfile = self.path + '/' + self.xmlfile.replace('.xml','_cells.vtu')
+            vw_writer = vtk.vtkXMLUnstructuredGridWriter()
+            vw_writer.SetFileName(s_vtkpathfile)
+            vw_writer.SetDataModeToAppended()  # raw binary, zlib compressed
+            vw_writer.SetEncodeAppendedData(False)
+            vw_writer.SetCompressorTypeToZLib()
+            vw_writer.SetInputData(vu_grid)
+            vw_writer.Write()
+
+        else:
+            # Create Glyph to save
+            vg_glyph = vtk.vtkGlyph3D()
+            vg_glyph.SetInputData(vu_grid)
+            vg_glyph.SetSourceConnection(vsp_sphere.GetOutputPort())
+
+            # Define important preferences for VTK
+            vg_glyph.ClampingOff()
+            vg_glyph.SetScaleModeToScaleByScalar()
+            vg_glyph.SetScaleFactor(1.0)
+            vg_glyph.SetColorModeToColorByScalar()
+            vg_glyph.Update()
+
+            # Write VTK
+            s_vtkpathfile = self.path + '/' + self.xmlfile.replace('.xml','_cells.vtk')
+            vw_writer = vtk.vtkXMLPolyDataWriter()
+            vw_writer.SetFileName(s_vtkpathfile)
+            vw_writer.SetDataModeToAppended()  # raw binary, zlib compressed
+            vw_writer.SetEncodeAppendedData(False)
+            vw_writer.SetCompressorTypeToZLib()
+            vw_writer.SetInputData(vg_glyph.GetOutput())
+            vw_writer.Write()
 
 
         # Visualize if needed
         if (visualize):
             # visualization
             # set up the mapper
-            mapper = vtk.vtkPolyDataMapper()
-            # mapper.SetInput(glyph.GetOutput())
-            mapper.SetInputConnection(vg_glyph.GetOutputPort())
+            if (glyph_mapper):
+                # instance the sphere per cell, scaled by radius
+                mapper = vtk.vtkGlyph3DMapper()
+                mapper.SetInputData(vu_grid)
+                mapper.SetSourceConnection(vsp_sphere.GetOutputPort())
+                mapper.SetScaleArray("radius")
+                mapper.SetScaleModeToScaleByMagnitude()
+                mapper.SetScaleFactor(1.0)
+                mapper.ScalingOn()
+            else:
+                mapper = vtk.vtkPolyDataMapper()
+                # mapper.SetInput(glyph.GetOutput())
+                mapper.SetInputConnection(vg_glyph.GetOutputPort())
 
             mapper.ScalarVisibilityOn()
             mapper.ColorByArrayComponent("data", 1)
@@ -1816,43 +2349,70 @@ class pyMCDS:
         # generate filename
         s_gmlpathfile = self.path + '/' + self.xmlfile.replace('.xml',f'_{graph_type}.gml')
 
-        # open result gml file
-        f = open(s_gmlpathfile, 'w')
-        f.write(f'Creator "pcdl_v{__version__}"\ngraph [\n')
-        f.write(f'  id {int(r_simtime)}\n  comment "time_{s_unit_simtime}"\n  label "{graph_type}_graph"\n  directed 0\n')
-        for i_src, ei_dst in dei_graph.items():
-            #print(f'{i_src} {sorted(ei_dst)}')
-            # node
-            f.write(f'  node [\n    id {i_src}\n    label "node_{i_src}"\n')
-            # node attributes
-            for s_attr in node_attr:
-                o_attr = df_cell.loc[i_src, s_attr]
-                if (type(o_attr) in {bool, np.bool_, int, np.int_, np.int8, np.int16, np.int32, np.int64}):
-                    f.write(f'    {s_attr} {int(o_attr)}\n')
-                elif (type(o_attr) in {float, np.float_, np.float16, np.float32, np.float64}):  # np.float128
-                    f.write(f'    {s_attr} {o_attr}\n')
-                elif (type(o_attr) in {str, np.str_}):
-                    f.write(f'    {s_attr} "{o_attr}"\n')
-                else:
-                    sys.exit(f'Error @ make_graph_gml : attr {o_attr}; type {type (o_attr)}; type seems not to be bool, int, float, or string.')
-            f.write(f'  ]\n')
-            # edge
-            for i_dst in ei_dst:
-                if (i_src < i_dst):
-                    f.write(f'  edge [\n    source {i_src}\n    target {i_dst}\n    label "edge_{i_src}_{i_dst}"\n')
-                    if (edge_attr):
-                        # edge distance attribute
-                        x = df_cell.loc[i_src, 'position_x'] - df_cell.loc[i_dst, 'position_x']
-                        y = df_cell.loc[i_src, 'position_y'] - df_cell.loc[i_dst, 'position_y']
-                        z = df_cell.loc[i_src, 'position_z'] - df_cell.loc[i_dst, 'position_z']
-                        r_distance = (x**2 + y**2 + z**2)**(1/2)
-                        f.write(f'    distance_{ds_unit["position_y"]} {round(r_distance)}\n')
-                    f.write(f'  ]\n')
-            # development
-            #if (i_src > 16):
-            #    break
-        # close result gml file
-        f.write(']\n')
+        # node attribute formatters, dispatched by numpy dtype kind
+        do_gml_format = {
+            'b': lambda o_attr: f'{int(o_attr)}',
+            'i': lambda o_attr: f'{int(o_attr)}',
+            'u': lambda o_attr: f'{int(o_attr)}',
+            'f': lambda o_attr: f'{o_attr}',
+            'O': lambda o_attr: f'"{o_attr}"',
+            'U': lambda o_attr: f'"{o_attr}"',
+            'S': lambda o_attr: f'"{o_attr}"',
+        }
+        lo_format = []
+        for s_attr in node_attr:
+            o_format = do_gml_format.get(df_cell.loc[:,s_attr].dtype.kind)
+            if (o_format is None):
+                sys.exit(f'Error @ make_graph_gml : attr {s_attr}; dtype {df_cell.loc[:,s_attr].dtype}; dtype seems not to be bool, int, float, or string.')
+            lo_format.append(o_format)
+
+        # node attribute values, one numpy array per attribute, in node order
+        li_node = list(dei_graph.keys())
+        la_attr = [df_cell.loc[li_node, s_attr].to_numpy() for s_attr in node_attr]
+
+        # node blocks, one string per node
+        ls_node = [
+            f'  node [\n    id {i_src}\n    label "node_{i_src}"\n' + \
+            ''.join([f'    {s_attr} {o_format(a_attr[i_node])}\n' for s_attr, o_format, a_attr in zip(node_attr, lo_format, la_attr)]) + \
+            '  ]\n'
+            for i_node, i_src in enumerate(li_node)
+        ]
+
+        # edge blocks, one string per edge, in source node order
+        lii_edge = [(i_src, i_dst) for i_src, ei_dst in dei_graph.items() for i_dst in ei_dst if (i_src < i_dst)]
+        if (edge_attr):
+            # edge distances, all computed at once
+            ar_position = df_cell.loc[:,['position_x','position_y','position_z']].to_numpy()
+            di_row = {i_cell: i_row for i_row, i_cell in enumerate(df_cell.index)}
+            ai_src = np.array([di_row[i_src] for i_src, _ in lii_edge], dtype=int)
+            ai_dst = np.array([di_row[i_dst] for _, i_dst in lii_edge], dtype=int)
+            ai_distance = np.rint(np.linalg.norm(ar_position[ai_src] - ar_position[ai_dst], axis=1)).astype(np.int64)
+            s_distance = f'distance_{ds_unit["position_y"]}'
+            ls_edge = [
+                f'  edge [\n    source {i_src}\n    target {i_dst}\n    label "edge_{i_src}_{i_dst}"\n    {s_distance} {i_distance}\n  ]\n'
+                for (i_src, i_dst), i_distance in zip(lii_edge, ai_distance.tolist())
+            ]
+        else:
+            ls_edge = [
+                f'  edge [\n    source {i_src}\n    target {i_dst}\n    label "edge_{i_src}_{i_dst}"\n  ]\n'
+                for i_src, i_dst in lii_edge
+            ]
+
+        # collect gml lines, each node followed by its edges
+        ls_line = []
+        ls_line.append(f'Creator "pcdl_v{__version__}"\ngraph [\n')
+        ls_line.append(f'  id {int(r_simtime)}\n  comment "time_{s_unit_simtime}"\n  label "{graph_type}_graph"\n  directed 0\n')
+        i_edge = 0
+        for i_src, s_node in zip(li_node, ls_node):
+            ls_line.append(s_node)
+            while (i_edge < len(lii_edge)) and (lii_edge[i_edge][0] == i_src):
+                ls_line.append(ls_edge[i_edge])
+                i_edge += 1
+        ls_line.append(']\n')
+
+        # write result gml file in one go
+        f = open(s_gmlpathfile, 'w', buffering=2**20)
+        f.writelines(ls_line)
         f.close()
 
         # output
@@ -1955,6 +2515,8 @@ class pyMCDS:
         d_mcds['setting']['rules'] = None  # df_ruleset
         d_mcds['mesh'] = {}
         d_mcds['continuum_variables'] = {}
+        d_mcds['continuum_block'] = None  # [substrate, j, i, k] shaped concentration array
+        d_mcds['cache'] = {'df_cell': None, 'df_conc': None}  # unfiltered get_cell_df and get_conc_df output, if self.cache
         d_mcds['discrete_cells'] = {}
         d_mcds['discrete_cells']['units'] = {}
 
@@ -1965,13 +2527,31 @@ class pyMCDS:
         # bue 2024-03-11: this part tries to be compatible with the PhysiCell Studio settings.xml file only,
         # older and other settings.xml versions are disregarded.
 
+        b_setting = False
         if not ((self.settingxml is None) or (self.settingxml is False)):
-            # load Physicell_settings xml file
+            # reuse cached extraction, if this settings file was read before and not modified since
             s_xmlpathfile_setting = self.path + '/' + self.settingxml
-            x_tree = ET.parse(s_xmlpathfile_setting)
+            t_setting = (os.path.abspath(s_xmlpathfile_setting), os.stat(s_xmlpathfile_setting).st_mtime_ns)
+            with o_cache_lock:
+                d_setting = do_setting_cache.get(t_setting)
+            if not (d_setting is None):
+                if self.verbose:
+                    print(f'reading: {s_xmlpathfile_setting} (cached)')
+                d_setting = copy.deepcopy(d_setting)  # cached entries are never modified
+                d_mcds['setting'] = d_setting['setting']
+                d_mcds['metadata']['substrate'] = d_setting['substrate']
+                d_mcds['metadata']['cell_type'] = d_setting['cell_type']
+            else:
+                b_setting = True
+
+        if b_setting:
+            # load Physicell_settings xml file
+            x_root = _iterparse_xml(
+                s_xmlpathfile_setting,
+                es_section = {'overall', 'options', 'microenvironment_setup', 'cell_definitions', 'user_parameters', 'cell_rules'},
+            )
             if self.verbose:
                 print(f'reading: {s_xmlpathfile_setting}')
-            x_root = x_tree.getroot()
 
             # skip <domain> node for mesh
 
@@ -2096,7 +2676,7 @@ class pyMCDS:
             # find <cell_definitions> node
             es_customdata = set()
             # cell loop
-            for x_celltype in x_root.find('cell_definitions').findall('cell_definition'):
+            for x_celltype in x_root.findall('cell_definitions/cell_definition'):
 
                 # <cell_definition>
                 s_id = str(x_celltype.get('ID'))
@@ -2110,11 +2690,11 @@ class pyMCDS:
                     # find <phenotype><cycle> node
                     x_cycle = x_phenotype.find('cycle')
                     if not (x_cycle is None):
-                        d_mcds['setting']['parameters'].update({f'{s_celltype}_cycle_model': ds_cycle_model[str(x_cycle.get('code'))]})
+                        d_mcds['setting']['parameters'].update({f'{s_celltype}_cycle_model': ds_cycle_model[int(x_cycle.get('code'))]})
                         # <phase_durations>
                         try:
                             for x_phase in x_cycle.find('phase_durations').findall('duration'):
-                                s_index = ds_cycle_phase[str(x_phase.get('index'))]
+                                s_index = ds_cycle_phase[int(x_phase.get('index'))]
                                 d_mcds['setting']['parameters'].update({f'{s_celltype}_cycle_phase_duration_{s_index}_fixed': str(x_phase.get('fixed_duration')).lower() == 'true'})
                                 d_mcds['setting']['parameters'].update({f'{s_celltype}_cycle_phase_duration_{s_index}': float(x_phase.text)})
                                 d_mcds['setting']['units'].update({f'{s_celltype}_cycle_phase_duration_{s_index}': x_phase.get('units')})
@@ -2123,7 +2703,7 @@ class pyMCDS:
                         # <phase_transition_rates>
                         try:
                             for x_phase in x_cycle.find('phase_transition_rates').findall('rate'):
-                                s_index = ds_cycle_phase[str(x_phase.get('start_index'))] + '_' + ds_cycle_phase[str(x_phase.get('end_index'))]
+                                s_index = ds_cycle_phase[int(x_phase.get('start_index'))] + '_' + ds_cycle_phase[int(x_phase.get('end_index'))]
                                 d_mcds['setting']['parameters'].update({f'{s_celltype}_cycle_phase_transition_rate_{s_index}_fixed': str(x_phase.get('fixed_duration')).lower() == 'true'})
                                 d_mcds['setting']['parameters'].update({f'{s_celltype}_cycle_phase_transition_rate_{s_index}': float(x_phase.text)})
                                 d_mcds['setting']['units'].update({f'{s_celltype}_cycle_phase_transition_rate_{s_index}': x_phase.get('units')})
@@ -2138,7 +2718,7 @@ class pyMCDS:
                         # <model>
                         for x_model in x_death.findall('model'):
                             s_code = str(x_model.get('code'))
-                            s_model = ds_death_model[s_code]  # apoptosis oder necrosis
+                            s_model = ds_death_model[int(s_code)]  # apoptosis oder necrosis
                             # <death_rate>
                             d_mcds['setting']['parameters'].update({f'{s_celltype}_death_{s_model}_rate': float(x_model.find('death_rate').text)})
                             # <phase_transition_rates>
@@ -2550,13 +3130,28 @@ class pyMCDS:
             else:
                 print(f'Warning @ pyMCDS._read_setting_xml : <cell_rules> node missing.')
 
+            # store extraction in the settings cache
+            d_setting = copy.deepcopy({
+                'setting': d_mcds['setting'],
+                'substrate': d_mcds['metadata']['substrate'],
+                'cell_type': d_mcds['metadata']['cell_type'],
+            })
+            with o_cache_lock:
+                do_setting_cache[t_setting] = d_setting
+                while (len(do_setting_cache) > i_setting_cache):
+                    do_setting_cache.pop(next(iter(do_setting_cache)))
+
 
         #######################################
         # read physicell output xml path/file #
         #######################################
 
         s_xmlpathfile = self.path + '/' + self.xmlfile
-        x_tree = ET.parse(s_xmlpathfile)
+        # lxml parser objects must not be shared between threads, so every parse gets its own parser
+        o_xmlparser = None
+        if not (do_xmlparser is None):
+            o_xmlparser = ET.XMLParser(**do_xmlparser)
+        x_tree = ET.parse(s_xmlpathfile, parser=o_xmlparser)
         if self.verbose:
             print(f'reading: {s_xmlpathfile}')
         x_root = x_tree.getroot()
@@ -2613,21 +3208,21 @@ class pyMCDS:
         d_mcds['metadata']['spatial_units'] = x_mesh.get('units')
 
         # while we're at it, find the mesh
-        s_x_coor = x_mesh.find('x_coordinates').text
-        s_delim = x_mesh.find('x_coordinates').get('delimiter')
+        x_x_coor = x_mesh.find('x_coordinates')
+        s_x_coor = x_x_coor.text
+        s_delim = x_x_coor.get('delimiter')
         ar_x_coor = np.array(s_x_coor.split(s_delim), dtype=np.float64)
 
-        s_y_coor = x_mesh.find('y_coordinates').text
-        s_delim = x_mesh.find('y_coordinates').get('delimiter')
+        x_y_coor = x_mesh.find('y_coordinates')
+        s_y_coor = x_y_coor.text
+        s_delim = x_y_coor.get('delimiter')
         ar_y_coor = np.array(s_y_coor.split(s_delim), dtype=np.float64)
 
-        s_z_coor = x_mesh.find('z_coordinates').text
-        s_delim = x_mesh.find('z_coordinates').get('delimiter')
+        x_z_coor = x_mesh.find('z_coordinates')
+        s_z_coor = x_z_coor.text
+        s_delim = x_z_coor.get('delimiter')
         ar_z_coor = np.array(s_z_coor.split(s_delim), dtype=np.float64)
 
-        # reshape into a meshgrid
-        d_mcds['mesh']['mnp_grid'] = np.array(np.meshgrid(ar_x_coor, ar_y_coor, ar_z_coor, indexing='xy'))
-
         # get mesh center axis
         d_mcds['mesh']['mnp_axis'] = [
             np.unique(ar_x_coor),
@@ -2649,16 +3244,23 @@ class pyMCDS:
             (0, len(d_mcds['mesh']['mnp_axis'][2]) - 1),
         ]
 
+        # get smallest integer type that can hold the voxel indices
+        if (max([ti_range[1] for ti_range in d_mcds['mesh']['ijk_range']]) <= np.iinfo(np.int16).max):
+            d_mcds['mesh']['ijk_dtype'] = np.int16
+        else:
+            d_mcds['mesh']['ijk_dtype'] = np.int32
+
         # get voxel axis
         d_mcds['mesh']['ijk_axis'] = [
-            np.array(range(d_mcds['mesh']['ijk_range'][0][1] + 1)),
-            np.array(range(d_mcds['mesh']['ijk_range'][1][1] + 1)),
-            np.array(range(d_mcds['mesh']['ijk_range'][2][1] + 1)),
+            np.arange(d_mcds['mesh']['ijk_range'][0][1] + 1, dtype=d_mcds['mesh']['ijk_dtype']),
+            np.arange(d_mcds['mesh']['ijk_range'][1][1] + 1, dtype=d_mcds['mesh']['ijk_dtype']),
+            np.arange(d_mcds['mesh']['ijk_range'][2][1] + 1, dtype=d_mcds['mesh']['ijk_dtype']),
         ]
 
         # get mesh bounding box range [xmin, ymin, zmin, xmax, ymax, zmax]
-        s_bboxcoor = x_mesh.find('bounding_box').text
-        s_delim = x_mesh.find('bounding_box').get('delimiter')
+        x_bboxcoor = x_mesh.find('bounding_box')
+        s_bboxcoor = x_bboxcoor.text
+        s_delim = x_bboxcoor.get('delimiter')
         ar_bboxcoor = np.array(s_bboxcoor.split(s_delim), dtype=np.float64)
 
         d_mcds['mesh']['xyz_range'] = [
@@ -2669,7 +3271,7 @@ class pyMCDS:
 
         # voxel data must be loaded from .mat file
         s_voxelpathfile = self.path + '/' + x_mesh.find('voxels').find('filename').text
-        ar_mesh_initial = io.loadmat(s_voxelpathfile)['mesh']
+        ar_mesh_initial = io.loadmat(s_voxelpathfile, variable_names=['mesh'], squeeze_me=False, mat_dtype=False)['mesh']
         if self.verbose:
             print(f'reading: {s_voxelpathfile}')
 
@@ -2678,6 +3280,10 @@ class pyMCDS:
         d_mcds['mesh']['mnp_coordinate'] = ar_mesh_initial[:3, :]
         d_mcds['mesh']['volumes'] = ar_mesh_initial[3, :]
 
+        # lock mesh arrays, so that the getters can return them without copy
+        for ar_mesh in [d_mcds['mesh']['mnp_coordinate'], d_mcds['mesh']['volumes']] + d_mcds['mesh']['mnp_axis'] + d_mcds['mesh']['ijk_axis']:
+            ar_mesh.setflags(write=False)
+
         # update settings unit with mesh infromation
         d_mcds['setting']['units'].update({'spatial_unit': d_mcds['metadata']['spatial_units']})
 
@@ -2694,7 +3300,7 @@ class pyMCDS:
             # centers. The fourth row contains the voxel volume. The 5th row and up will
             # contain values for that species in that voxel.
             s_microenvpathfile = self.path + '/' +  x_microenv.find('data').find('filename').text
-            ar_microenv = io.loadmat(s_microenvpathfile)['multiscale_microenvironment']
+            ar_microenv = io.loadmat(s_microenvpathfile, variable_names=['multiscale_microenvironment'], squeeze_me=False, mat_dtype=False)['multiscale_microenvironment']
             if self.verbose:
                 print(f'reading: {s_microenvpathfile}')
 
@@ -2703,8 +3309,23 @@ class pyMCDS:
             # d_mcds['continuum_variables']['oxygen']['units']
             # d_mcds['continuum_variables']['glucose']['data']
 
+            # one contiguous block for all substrate concentrations, in substrate ID order.
+            # each substrate's meshgrid shaped data array is a view into this block.
+            lx_substrate = x_microenv.findall('variables/variable')
+            ti_shape = (d_mcds['mesh']['mnp_axis'][1].shape[0], d_mcds['mesh']['mnp_axis'][0].shape[0], d_mcds['mesh']['mnp_axis'][2].shape[0])  # meshgrid [j,i,k] shape
+            d_mcds['continuum_block'] = np.zeros((len(lx_substrate),) + ti_shape)
+
+            # voxel index for each voxel center, computed from the mesh spacing, or looked up, if the mesh is not uniform
+            ai_i, ai_j, ai_k = [
+                _axis_voxel_index(ar_axis, d_mcds['mesh']['mnp_coordinate'][i_axis, :])
+                for i_axis, ar_axis in enumerate(d_mcds['mesh']['mnp_axis'])
+            ]
+
+            # store data from microenvironment file, all substrates and voxels at once
+            d_mcds['continuum_block'][:, ai_j, ai_i, ai_k] = ar_microenv[4:4+len(lx_substrate), :]
+
             # substrate loop
-            for i_s, x_substrate in enumerate(x_microenv.find('variables').findall('variable')):
+            for i_s, x_substrate in enumerate(lx_substrate):
                 # i don't like spaces in species names!
                 s_substrate = x_substrate.get('name').replace(' ', '_')
 
@@ -2718,31 +3339,21 @@ class pyMCDS:
                 d_mcds['metadata']['substrate'].update({str(i_s) : s_substrate})
 
                 # initialize meshgrid shaped array for concentration data
-                d_mcds['continuum_variables'][s_substrate]['data'] = np.zeros(d_mcds['mesh']['mnp_grid'][0].shape)
+                d_mcds['continuum_variables'][s_substrate]['data'] = d_mcds['continuum_block'][i_s]
+
+                x_parameter = x_substrate.find('physical_parameter_set')
 
                 # diffusion data for each species
+                x_diffusion = x_parameter.find('diffusion_coefficient')
                 d_mcds['continuum_variables'][s_substrate]['diffusion_coefficient'] = {}
-                d_mcds['continuum_variables'][s_substrate]['diffusion_coefficient']['value'] = float(x_substrate.find('physical_parameter_set').find('diffusion_coefficient').text)
-                d_mcds['continuum_variables'][s_substrate]['diffusion_coefficient']['units'] = x_substrate.find('physical_parameter_set').find('diffusion_coefficient').get('units')
+                d_mcds['continuum_variables'][s_substrate]['diffusion_coefficient']['value'] = float(x_diffusion.text)
+                d_mcds['continuum_variables'][s_substrate]['diffusion_coefficient']['units'] = x_diffusion.get('units')
 
                 # decay data for each species
+                x_decay = x_parameter.find('decay_rate')
                 d_mcds['continuum_variables'][s_substrate]['decay_rate'] = {}
-                d_mcds['continuum_variables'][s_substrate]['decay_rate']['value']  = float(x_substrate.find('physical_parameter_set').find('decay_rate').text)
-                d_mcds['continuum_variables'][s_substrate]['decay_rate']['units']  = x_substrate.find('physical_parameter_set').find('decay_rate').get('units')
-
-                # store data from microenvironment file as numpy array
-                # iterate over each voxel
-                # bue: i have a hunch this could be faster reimplemented.
-                for vox_idx in range(d_mcds['mesh']['mnp_coordinate'].shape[1]):
-
-                    # find the voxel coordinate
-                    ar_center = d_mcds['mesh']['mnp_coordinate'][:, vox_idx]
-                    i = np.where(np.abs(ar_center[0] - d_mcds['mesh']['mnp_axis'][0]) < 1e-10)[0][0]
-                    j = np.where(np.abs(ar_center[1] - d_mcds['mesh']['mnp_axis'][1]) < 1e-10)[0][0]
-                    k = np.where(np.abs(ar_center[2] - d_mcds['mesh']['mnp_axis'][2]) < 1e-10)[0][0]
-
-                    # store value
-                    d_mcds['continuum_variables'][s_substrate]['data'][j, i, k] = ar_microenv[4+i_s, vox_idx]
+                d_mcds['continuum_variables'][s_substrate]['decay_rate']['value']  = float(x_decay.text)
+                d_mcds['continuum_variables'][s_substrate]['decay_rate']['units']  = x_decay.get('units')
 
                 # update settings unit wuth substrate parameters
                 d_mcds['setting']['units'].update({s_substrate: d_mcds['continuum_variables'][s_substrate]['units']})
@@ -2762,14 +3373,11 @@ class pyMCDS:
         x_cell = x_root.find('cellular_information').find('cell_populations').find('cell_population').find('custom')
 
         # we want the PhysiCell data, there is more of it
-        for x_simplified_data in x_cell.findall('simplified_data'):
-            if x_simplified_data.get('source') == 'PhysiCell':
-                x_celldata = x_simplified_data
-                break
+        x_celldata = x_cell.find("simplified_data[@source='PhysiCell']")
 
         # iterate over labels which are children of labels these will be used to label data arrays
         ls_variable = []
-        for label in x_celldata.find('labels').findall('label'):
+        for label in x_celldata.findall('labels/label'):
             # I don't like spaces in my dictionary keys!
             s_variable = label.text.replace(' ', '_')
             i_variable = int(label.get('size'))
@@ -2828,7 +3436,7 @@ class pyMCDS:
         # load the file
         s_cellpathfile = self.path + '/' + x_celldata.find('filename').text
         try:
-            ar_cell = io.loadmat(s_cellpathfile)['cells']
+            ar_cell = io.loadmat(s_cellpathfile, variable_names=['cells'], squeeze_me=False, mat_dtype=False)['cells']
             if self.verbose:
                 print(f'reading: {s_cellpathfile}')
         except ValueError:  # hack: some old PhysiCell versions generates a corrupt cells.mat file, if there are zero cells.
@@ -2845,31 +3453,33 @@ class pyMCDS:
         # handle graph data #
         #####################
 
-        d_mcds['discrete_cells']['graph'] = {}
-        d_mcds['discrete_cells']['graph'].update({'neighbor_cells': {}})
-        d_mcds['discrete_cells']['graph'].update({'attached_cells': {}})
+        d_mcds['discrete_cells']['graph'] = {'neighbor_cells': {}, 'attached_cells': {}}
 
         if self.graph:
             if self.verbose:
                 print('working on graph data ...')
 
-            # neighborhood cell graph
-            s_cellpathfile = self.path + '/' + x_cell.find('neighbor_graph').find('filename').text
-            dei_graph = graphfile_parser(s_pathfile=s_cellpathfile)
-            if self.verbose:
-                print(f'reading: {s_cellpathfile}')
+            # neighborhood and attached cell graph
+            ds_graphfile = {x_graph.tag: x_graph.findtext('filename') for x_graph in x_cell if str(x_graph.tag).endswith('_graph')}
+            s_path = self.path + '/'
+            lts_graph = [
+                ('neighbor_cells', f"{s_path}{ds_graphfile['neighbor_graph']}"),
+                ('attached_cells', f"{s_path}{ds_graphfile['attached_cells_graph']}"),
+            ]
+
+            # the graph files are independent, so they can be read in parallel
+            with ThreadPoolExecutor(max_workers=len(lts_graph)) as o_executor:
+                ldei_graph = list(o_executor.map(_graphfile_parser_cache, [s_cellpathfile for _, s_cellpathfile in lts_graph]))
 
             # store data
-            d_mcds['discrete_cells']['graph'].update({'neighbor_cells': dei_graph})
+            ls_message = []
+            for (s_graph, s_cellpathfile), dei_graph in zip(lts_graph, ldei_graph):
+                ls_message.append(f'reading: {s_cellpathfile}')
+                d_mcds['discrete_cells']['graph'][s_graph] = dei_graph
 
-            # attached cell graph
-            s_cellpathfile = self.path + '/' + x_cell.find('attached_cells_graph').find('filename').text
-            dei_graph = graphfile_parser(s_pathfile=s_cellpathfile)
+            # verbose reading output in one write
             if self.verbose:
-                print(f'reading: {s_cellpathfile}')
-
-            # store data
-            d_mcds['discrete_cells']['graph'].update({'attached_cells': dei_graph})
+                sys.stdout.write('\n'.join(ls_message) + '\n')
 
 
         #########################
@@ -2893,13 +3503,11 @@ class pyMCDS:
                 df_physiboss = pd.read_csv(s_intracellpathfile, index_col=0)
 
                 # add nodes
-                df_physiboss[f'state_nil'] = df_physiboss.state.str.find('<nil>') > -1
-                es_node = set()
-                for s_state in df_physiboss.state.unique():
-                    es_node = es_node.union(set(s_state.split(' -- ')))
-                es_node.discard('<nil>')
-                for s_node in sorted(es_node):
-                    df_physiboss[f'node_{s_node}'] = df_physiboss.state.str.find(s_node) > -1
+                df_physiboss['state_nil'] = df_physiboss.state.str.contains('<nil>', regex=False)
+                df_node = df_physiboss.state.str.get_dummies(sep=' -- ').astype(bool)
+                df_node = df_node.drop(columns=['<nil>'], errors='ignore')
+                df_node.columns = [f'node_{s_node}' for s_node in df_node.columns]
+                df_physiboss = pd.concat([df_physiboss, df_node], axis=1)
 
             else:
                 print(f'Warning @ pyMCDS._read_xml : physiboss file missing {s_intracellpathfile}.')
@@ -20,16 +20,21 @@
 
 
 # load libraries
+from concurrent.futures import ThreadPoolExecutor
 import matplotlib.pyplot as plt
 import glob
 import numpy as np
 import os
 import pandas as pd
+from pandas.api import types as pdt
 import pathlib
-from pcdl.pyMCDS import pyMCDS, es_coor_cell, es_coor_conc
+from pcdl.pyMCDS import pyMCDS, es_coor_cell, es_coor_conc, _snap_to_axis
 import platform
 import sys
-import xml.etree.ElementTree as ET
+try:
+    from lxml import etree as ET
+except ModuleNotFoundError:
+    import xml.etree.ElementTree as ET
 
 
 ############
@@ -156,6 +161,49 @@ def make_movie(path, interface='jpeg', framerate=12):
     return s_opathfile
 
 
+## PLOTTING RELATED FUNCTIONS ##
+def _read_svg(s_pathfile, circle=False):
+    """
+    input:
+        s_pathfile: string
+            path to and file name from the initial.svg file.
+
+        circle: boolean; default False
+            should the radius of the first circle element be read as well?
+
+    output:
+        i_width: integer
+            svg width in pixel, rounded up.
+
+        i_height: integer
+            svg height in pixel, rounded up.
+
+        r_radius: floating point number or None
+            radius of the first circle element in pixel.
+            None, if circle is False or the svg contains no circle.
+
+    description:
+        internal function streams through the svg file and stops,
+        as soon as the requested attributes are found, instead of
+        building the whole element tree.
+    """
+    i_width = None
+    i_height = None
+    r_radius = None
+    with open(s_pathfile, 'rb') as f:
+        for _, x_element in ET.iterparse(f, events=('start',)):
+            if (i_width is None):
+                # root svg element
+                i_width = int(np.ceil(float(x_element.get('width')))) # px
+                i_height = int(np.ceil(float(x_element.get('height'))))  # px
+                if not circle:
+                    break
+            elif (x_element.tag.split('}')[-1] == 'circle'):
+                r_radius = float(x_element.get('r')) # px
+                break
+    return i_width, i_height, r_radius
+
+
 ###########
 # classes #
 ###########
@@ -302,7 +350,7 @@ class pyMCDSts:
         return self.l_mcds
 
 
-    def read_mcds(self, xmlfile_list=None):
+    def read_mcds(self, xmlfile_list=None, threads=1):
         """
         input:
             self: pyMCDSts class instance.
@@ -310,6 +358,12 @@ class pyMCDSts:
             xmlfile_list: list of strings; default None
                 list of physicell output output*.xml strings.
 
+            threads: integer; default 1
+                number of time steps to be loaded in parallel.
+                xml parsing and mat file decompression release the gil,
+                so loading in threads can speed up processing of long time series.
+                the verbose text output of parallel loaded time steps might interleave.
+
         output:
             self.l_mcds: list of mcds objects
 
@@ -324,8 +378,7 @@ class pyMCDSts:
         ls_xmlpathfile = [f'{self.output_path}{s_xmlfile}' for s_xmlfile in ls_xmlfile]
 
         # load mcds objects into list
-        l_mcds = []
-        for s_xmlpathfile in ls_xmlpathfile:
+        def _read_mcds(s_xmlpathfile):
             mcds = pyMCDS(
                 xmlfile = s_xmlpathfile,
                 custom_type = self.custom_type,
@@ -335,9 +388,15 @@ class pyMCDSts:
                 settingxml = self.settingxml,
                 verbose = self.verbose
             )
-            l_mcds.append(mcds)
             if self.verbose:
                 print() # carriage return
+            return mcds
+
+        if (threads > 1) and (len(ls_xmlpathfile) > 1):
+            with ThreadPoolExecutor(max_workers=threads) as o_executor:
+                l_mcds = list(o_executor.map(_read_mcds, ls_xmlpathfile))
+        else:
+            l_mcds = [_read_mcds(s_xmlpathfile) for s_xmlpathfile in ls_xmlpathfile]
 
         # output
         self.l_mcds = l_mcds
@@ -347,7 +406,7 @@ class pyMCDSts:
 
     ## MICROENVIRONMENT RELATED FUNCTIONS ##
 
-    def get_conc_df(self, values=1, drop=set(), keep=set(), collapse=True):
+    def get_conc_df(self, values=1, drop=set(), keep=set(), collapse=True, dtype=np.float64):
         """
         input:
             self: pyMCDSts class instance.
@@ -375,6 +434,10 @@ class pyMCDSts:
                 into one pandas datafarme object, or a list of datafarme objects
                 for each time step?
 
+            dtype: numpy floating point data type; default is np.float64
+                data type for the substrate concentration columns.
+                np.float32 halves the memory footprint of these columns.
+
         output:
             df_conc or ldf_conc: pandas dataframe or list of dataframe
                 dataframe stores all substrate concentrations in each voxel.
@@ -396,6 +459,7 @@ class pyMCDSts:
                     values = 1,
                     drop = drop,
                     keep = keep,
+                    dtype = dtype,
                 )
                 if df_concts is None:
                     df_concts = df_conc
@@ -407,6 +471,7 @@ class pyMCDSts:
                     values = values,
                     drop = drop,
                     keep = keep,
+                    dtype = dtype,
                 )
                 ldf_concts.append(df_conc)
 
@@ -420,10 +485,10 @@ class pyMCDSts:
                 es_delete = es_feature.intersection(drop)
 
             if (values > 1):  # by minimal number of states
-                for s_column in set(df_concts.columns).difference(es_coor_conc):
-                    if len(set(df_concts.loc[:,s_column])) < values:
+                for s_column in es_feature.difference(es_delete):
+                    if (df_concts.loc[:,s_column].nunique(dropna=False) < values):
                         es_delete.add(s_column)
-            df_concts.drop(es_delete, axis=1, inplace=True)
+            df_concts = df_concts.loc[:,[s_column for s_column in df_concts.columns if not (s_column in es_delete)]]
             df_concts.index.name = 'index'
             return df_concts
 
@@ -577,10 +642,7 @@ class pyMCDSts:
         if (figsizepx is None):
             s_pathfile = self.output_path + 'initial.svg'
             try:
-                tree = ET.parse(s_pathfile)
-                root = tree.getroot()
-                i_width = int(np.ceil(float(root.get('width')))) # px
-                i_height = int(np.ceil(float(root.get('height'))))  # px
+                i_width, i_height, _ = _read_svg(s_pathfile, circle=False)
                 figsizepx = [i_width, i_height]
             except FileNotFoundError:
                 print(f'Warning @ pyMCDSts.plot_contour : could not load {s_pathfile}.')
@@ -600,7 +662,7 @@ class pyMCDSts:
         z_slice = float(z_slice)
         _, _, ar_p_axis = self.get_mcds_list()[0].get_mesh_mnp_axis()
         if not (z_slice in ar_p_axis):
-            z_slice = ar_p_axis[abs(ar_p_axis - z_slice).argmin()]
+            z_slice = _snap_to_axis(ar_p_axis, z_slice)
             if self.verbose:
                 print(f'z_slice set to {z_slice}.')
 
@@ -608,9 +670,9 @@ class pyMCDSts:
         if extrema == None:
             extrema = [None, None]
             for mcds in self.get_mcds_list():
-                df_conc = mcds.get_concentration_df()
-                r_min = df_conc.loc[:,focus].min()
-                r_max = df_conc.loc[:,focus].max()
+                ar_conc = mcds.get_concentration(substrate=focus, z_slice=None)
+                r_min = np.nanmin(ar_conc)
+                r_max = np.nanmax(ar_conc)
                 if (extrema[0] is None) or (extrema[0] > r_min):
                     extrema[0] = np.floor(r_min)
                 if (extrema[1] is None) or (extrema[1] < r_max):
@@ -742,10 +804,10 @@ class pyMCDSts:
                 es_delete = es_feature.intersection(drop)
 
             if (values > 1):  # by minimal number of states
-                for s_column in set(df_cellts.columns).difference(es_coor_cell):
-                    if len(set(df_cellts.loc[:,s_column])) < values:
+                for s_column in es_feature.difference(es_delete):
+                    if (df_cellts.loc[:,s_column].nunique(dropna=False) < values):
                         es_delete.add(s_column)
-            df_cellts.drop(es_delete, axis=1, inplace=True)
+            df_cellts = df_cellts.loc[:,[s_column for s_column in df_cellts.columns if not (s_column in es_delete)]]
             df_cellts.reset_index(inplace=True)
             df_cellts.index.name = 'index'
             return df_cellts
@@ -914,12 +976,9 @@ class pyMCDSts:
         if (s is None) or (figsizepx is None):
             s_pathfile = self.output_path + 'initial.svg'
             try:
-                tree = ET.parse(s_pathfile)
-                root = tree.getroot()
+                i_width, i_height, r_radius = _read_svg(s_pathfile, circle=(s is None))
                 if s is None:
-                    circle_element = root.find('.//{*}circle')
-                    if not (circle_element is None):
-                        r_radius = float(circle_element.get('r')) # px
+                    if not (r_radius is None):
                         s = int(round((r_radius)**2))
                     else:
                         print(f'Warning @ pyMCDSts.plot_scatter : these agents are not circles.')
@@ -927,8 +986,6 @@ class pyMCDSts:
                     if self.verbose:
                         print(f's set to {s}.')
                 if figsizepx is None:
-                    i_width = int(np.ceil(float(root.get('width')))) # px
-                    i_height = int(np.ceil(float(root.get('height'))))  # px
                     figsizepx = [i_width, i_height]
             except FileNotFoundError:
                 print(f'Warning @ pyMCDSts.plot_scatter : could not load {s_pathfile}.')
@@ -953,31 +1010,31 @@ class pyMCDSts:
         z_slice = float(z_slice)
         _, _, ar_p_axis = self.get_mcds_list()[0].get_mesh_mnp_axis()
         if not (z_slice in ar_p_axis):
-            z_slice = ar_p_axis[abs(ar_p_axis - z_slice).argmin()]
+            z_slice = _snap_to_axis(ar_p_axis, z_slice)
             if self.verbose:
                 print(f'z_slice set to {z_slice}.')
 
+        # extract focus column and agent count from each time step once
+        lse_focus = [mcds.get_cell_df().loc[:,focus] for mcds in self.get_mcds_list()]
+
         # handle z_axis categorical cases
-        df_cell = self.get_mcds_list()[0].get_cell_df()
-        if (str(df_cell.loc[:,focus].dtype) in {'bool', 'object'}):
+        if pdt.is_bool_dtype(lse_focus[0]) or pdt.is_object_dtype(lse_focus[0]):
             if (z_axis is None):
                 # extract set of labels from data
                 z_axis = set()
-                for mcds in self.get_mcds_list():
-                    df_cell = mcds.get_cell_df()
-                    z_axis = z_axis.union(set(df_cell.loc[:,focus]))
-                if (str(df_cell.loc[:,focus].dtype) in {'bool'}):
+                for se_focus in lse_focus:
+                    z_axis = z_axis.union(set(se_focus))
+                if pdt.is_bool_dtype(lse_focus[-1]):
                     z_axis = z_axis.union({True, False})
 
         # handle z_axis numerical cases
-        else:  # df_cell.loc[:,focus].dtype is numeric
+        else:  # focus column dtype is numeric
             if (z_axis is None):
                 # extract min and max values from data
                 z_axis = [None, None]
-                for mcds in self.get_mcds_list():
-                    df_cell = mcds.get_cell_df()
-                    r_min = df_cell.loc[:,focus].min()
-                    r_max = df_cell.loc[:,focus].max()
+                for se_focus in lse_focus:
+                    r_min = se_focus.min()
+                    r_max = se_focus.max()
                     if (z_axis[0] is None) or (z_axis[0] > r_min):
                         z_axis[0] = np.floor(r_min)
                     if (z_axis[1] is None) or (z_axis[1] < r_max):
@@ -1006,14 +1063,13 @@ class pyMCDSts:
 
         # plotting
         for i, mcds in enumerate(self.get_mcds_list()):
-            df_cell = mcds.get_cell_df()
             fig = mcds.plot_scatter(
                 focus = focus,
                 z_slice = z_slice,
                 z_axis = z_axis,
                 alpha = alpha,
                 cmap = cmap,
-                title = f'{title}{focus} z{round(z_slice,9)}\n{df_cell.shape[0]}[agent] {round(mcds.get_time(),9)}[min]',
+                title = f'{title}{focus} z{round(z_slice,9)}\n{lse_focus[i].shape[0]}[agent] {round(mcds.get_time(),9)}[min]',
                 grid = grid,
                 legend_loc = legend_loc,
                 xlim = xlim,
@@ -1216,7 +1272,7 @@ class pyMCDSts:
         if not (z_slice is None):
             _, _, ar_p_axis = self.get_mcds_list()[0].get_mesh_mnp_axis()
             if not (z_slice in ar_p_axis):
-                z_slice = ar_p_axis[abs(ar_p_axis - z_slice).argmin()]
+                z_slice = _snap_to_axis(ar_p_axis, z_slice)
                 if self.verbose:
                     print(f'z_slice set to {z_slice}.')
 
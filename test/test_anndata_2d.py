@@ -81,12 +81,61 @@ class TestPyAnndataTimeStep(object):
         assert(str(type(mcds)) == "<class 'pcdl.pyAnnData.TimeStep'>") and \
               (str(type(ann)) == "<class 'anndata._core.anndata.AnnData'>") and \
               (ann.X.shape == (1099, 79)) and \
+              (ann.X.dtype == np.float32) and \
               (ann.obs.shape == (1099, 6)) and \
               (ann.obsm['spatial'].shape == (1099, 2)) and \
               (len(ann.obsp) == 2) and \
               (ann.var.shape == (79, 0)) and \
               (len(ann.uns) == 1)
 
+    def test_mcds_anndextract_legacy(self):
+        mcds = pcdl.TimeStep(s_pathfile_2d, verbose=False)
+        df_cell = mcds.get_cell_df(values=1, drop=set(), keep=set())
+        df_count, df_obs, d_obsm, d_obsp, d_uns = pcdl.pyAnnData._anndextract_legacy(
+            df_cell = df_cell,
+            graph_attached = mcds.get_attached_graph_dict(),
+            graph_neighbor = mcds.get_neighbor_graph_dict(),
+        )
+        assert(df_count.shape == (1099, 79)) and \
+              (df_obs.shape == (1099, 6)) and \
+              (d_obsm['spatial'].shape == (1099, 2)) and \
+              (len(d_obsp) == 2) and \
+              (len(d_uns) == 1)
+
+    def test_mcds_anndextract_input(self):
+        mcds = pcdl.TimeStep(s_pathfile_2d, verbose=False)
+        df_cell = mcds.get_cell_df(values=1, drop=set(), keep=set())
+        li_index = list(df_cell.index)
+        ls_column = list(df_cell.columns)
+        pcdl.pyAnnData._anndextract(df_cell=df_cell, return_anndata=True)
+        assert(list(df_cell.index) == li_index) and \
+              (pd.api.types.is_integer_dtype(df_cell.index)) and \
+              (list(df_cell.columns) == ls_column)
+
+    def test_mcds_anndextract_graph_id(self):
+        mcds = pcdl.TimeStep(s_pathfile_2d, verbose=False)
+        df_cell = mcds.get_cell_df(values=1, drop=set(), keep=set())
+        dei_neighbor = mcds.get_neighbor_graph_dict()
+        _, _, _, d_obsp, _ = pcdl.pyAnnData._anndextract(df_cell=df_cell.copy(), graph_neighbor=dei_neighbor)
+        # sparse cell id space
+        i_offset = 2**40
+        df_sparse = df_cell.copy()
+        df_sparse.index = df_sparse.index + i_offset
+        dei_sparse = {i_src + i_offset : {i_dst + i_offset for i_dst in ei_dst} for i_src, ei_dst in dei_neighbor.items()}
+        _, _, _, d_obsp_sparse, _ = pcdl.pyAnnData._anndextract(df_cell=df_sparse, graph_neighbor=dei_sparse)
+        # unknown cell id
+        dei_unknown = {i_src: ei_dst.copy() for i_src, ei_dst in dei_neighbor.items()}
+        dei_unknown[next(iter(dei_unknown))].add(df_cell.index.max() + 1)
+        try:
+            pcdl.pyAnnData._anndextract(df_cell=df_cell.copy(), graph_neighbor=dei_unknown)
+            b_keyerror = False
+        except KeyError:
+            b_keyerror = True
+        assert(d_obsp['physicell_neighbor_conectivities'].nnz > 0) and \
+              ((d_obsp['physicell_neighbor_conectivities'] != d_obsp_sparse['physicell_neighbor_conectivities']).nnz == 0) and \
+              ((d_obsp['physicell_neighbor_distances'] != d_obsp_sparse['physicell_neighbor_distances']).nnz == 0) and \
+              (b_keyerror)
+
 
 ## load physicell data time series ##
 class TestPyAnndataTimeSeries(object):
@@ -109,6 +158,7 @@ class TestPyAnndataTimeSeries(object):
               (mcdsts.l_annmcds is None) and \
               (str(type(ann)) == "<class 'anndata._core.anndata.AnnData'>") and \
               (ann.X.shape == (24758, 79)) and \
+              (ann.X.dtype == np.float32) and \
               (ann.obs.shape == (24758, 7)) and \
               (ann.obsm['spatial'].shape == (24758, 2)) and \
               (len(ann.obsp) == 0) and \
@@ -142,6 +192,7 @@ class TestPyAnndataTimeSeries(object):
               (len(mcdsts.l_annmcds) == 25) and \
               (all([str(type(ann)) == "<class 'anndata._core.anndata.AnnData'>" for ann in mcdsts.l_annmcds])) and \
               (mcdsts.l_annmcds[24].X.shape == (1099, 79)) and \
+              (mcdsts.l_annmcds[24].X.dtype == np.float32) and \
               (mcdsts.l_annmcds[24].obs.shape == (1099, 6)) and \
               (mcdsts.l_annmcds[24].obsm['spatial'].shape == (1099, 2)) and \
               (len(mcdsts.l_annmcds[24].obsp) == 2) and \
@@ -170,6 +170,30 @@ class TestPyMcdsTsInit(object):
               (len(mcdsts.l_mcds) == 3) and \
               (mcdsts.l_mcds == l_mcds)
 
+    def test_mcdsts_read_mcds_threads(self):
+        mcdsts = pcdl.pyMCDSts(s_path_2d, load=False, verbose=False)
+        ls_xmlfile = mcdsts.get_xmlfile_list()
+        ls_xmlfile = ls_xmlfile[-3:]
+        l_mcds = mcdsts.read_mcds(ls_xmlfile, threads=3)
+        assert(str(type(mcdsts)) == "<class 'pcdl.pyMCDSts.pyMCDSts'>") and \
+              (str(type(mcdsts.l_mcds[0])) == "<class 'pcdl.pyMCDS.pyMCDS'>") and \
+              (str(type(mcdsts.l_mcds[-1])) == "<class 'pcdl.pyMCDS.pyMCDS'>") and \
+              (mcdsts.l_mcds[0].get_time() == 1320) and \
+              (mcdsts.l_mcds[-1].get_time() == 1440) and \
+              (len(mcdsts.l_mcds) == 3) and \
+              (mcdsts.l_mcds == l_mcds)
+
+    def test_mcdsts_read_mcds_threads_all(self):
+        mcdsts = pcdl.pyMCDSts(s_path_2d, load=False, verbose=False)
+        ls_xmlfile = mcdsts.get_xmlfile_list()
+        l_mcds_thread = mcdsts.read_mcds(ls_xmlfile, threads=8)
+        l_mcds = mcdsts.read_mcds(ls_xmlfile, threads=1)
+        assert(len(l_mcds_thread) == 25) and \
+              ([mcds.get_time() for mcds in l_mcds_thread] == [mcds.get_time() for mcds in l_mcds]) and \
+              ([mcds.get_cell_df().shape for mcds in l_mcds_thread] == [mcds.get_cell_df().shape for mcds in l_mcds]) and \
+              ([mcds.get_substrate_names() for mcds in l_mcds_thread] == [mcds.get_substrate_names() for mcds in l_mcds]) and \
+              ([len(mcds.get_neighbor_graph_dict()) for mcds in l_mcds_thread] == [len(mcds.get_neighbor_graph_dict()) for mcds in l_mcds])
+
 
 ## micro environment related functions ##
 
@@ -24,6 +24,8 @@ import numpy as np
 import os
 import pathlib
 import pcdl
+from pcdl.pyMCDS import _axis_voxel_index
+import warnings
 
 
 # const
@@ -65,6 +67,34 @@ class TestPyMcdsInit(object):
               (set(df_cell.columns).issuperset({'cancer_cell_attack_rates'})) and \
               (df_cell.shape == (1099, 95))
 
+    def test_mcds_init_settingxml_cache(self):
+        mcds_first = pcdl.pyMCDS(xmlfile=s_file_2d, output_path=s_path_2d, custom_type={}, microenv=True, graph=False, physiboss=False, settingxml='PhysiCell_settings.xml', verbose=False)
+        mcds_first.data['setting']['parameters'].clear()
+        mcds_cache = pcdl.pyMCDS(xmlfile=s_file_2d, output_path=s_path_2d, custom_type={}, microenv=True, graph=False, physiboss=False, settingxml='PhysiCell_settings.xml', verbose=False)
+        assert(str(type(mcds_cache)) == "<class 'pcdl.pyMCDS.pyMCDS'>") and \
+              (len(mcds_first.data['setting']['parameters']) == 0) and \
+              (len(mcds_cache.data['setting']['parameters']) > 0) and \
+              (mcds_cache.data['metadata']['cell_type'] == {'0': 'cancer_cell'})
+
+    def test_mcds_init_graph_cache(self):
+        mcds_first = pcdl.pyMCDS(xmlfile=s_file_2d, output_path=s_path_2d, custom_type={}, microenv=False, graph=True, physiboss=False, settingxml='PhysiCell_settings.xml', verbose=False)
+        mcds_first.data['discrete_cells']['graph']['neighbor_cells'].clear()
+        mcds_cache = pcdl.pyMCDS(xmlfile=s_file_2d, output_path=s_path_2d, custom_type={}, microenv=False, graph=True, physiboss=False, settingxml='PhysiCell_settings.xml', verbose=False)
+        assert(str(type(mcds_cache)) == "<class 'pcdl.pyMCDS.pyMCDS'>") and \
+              (len(mcds_first.data['discrete_cells']['graph']['neighbor_cells']) == 0) and \
+              (len(mcds_cache.data['discrete_cells']['graph']['neighbor_cells']) == 1099) and \
+              (str(type(mcds_cache.data['discrete_cells']['graph']['neighbor_cells'][0])) == "<class 'set'>")
+
+    def test_mcds_init_axis_voxel_index(self):
+        ar_uniform = np.array([-10., 10., 30., 50.])
+        ar_nonuniform = np.array([-10., 0., 30., 130.])
+        ai_uniform = _axis_voxel_index(ar_uniform, np.array([50., -10., 30., 10., 30.]))
+        ai_nonuniform = _axis_voxel_index(ar_nonuniform, np.array([130., -10., 30., 0., 30.]))
+        ai_single = _axis_voxel_index(np.array([0.]), np.array([0., 0.]))
+        assert(list(ai_uniform) == [3, 0, 2, 1, 2]) and \
+              (list(ai_nonuniform) == [3, 0, 2, 1, 2]) and \
+              (list(ai_single) == [0, 0])
+
 
 class TestPyMcdsInitMicroenvFalse(object):
     ''' tests for loading a pcdl.pyMCDS data set with microenv false. '''
@@ -229,6 +259,44 @@ class TestPyMcdsInitVerboseFalse(object):
               (mcds.verbose)
 
 
+class TestPyMcdsInitCache(object):
+    ''' tests for loading a pcdl.pyMCDS data set and set_cache_true, set_cache_false, and clear_cache function. '''
+    mcds = pcdl.pyMCDS(xmlfile=s_file_2d, output_path=s_path_2d, custom_type={}, microenv=True, graph=False, physiboss=False, settingxml='PhysiCell_settings.xml', verbose=False)
+
+    def test_mcds_cache_false(self, mcds=mcds):
+        df_cell = mcds.get_cell_df()
+        df_conc = mcds.get_conc_df()
+        assert(str(type(mcds)) == "<class 'pcdl.pyMCDS.pyMCDS'>") and \
+              (not mcds.cache) and \
+              (df_cell.shape[0] == 1099) and \
+              (df_conc.shape[0] > 0) and \
+              (mcds.data['cache']['df_cell'] is None) and \
+              (mcds.data['cache']['df_conc'] is None)
+
+    def test_mcds_set_cache_true(self, mcds=mcds):
+        mcds.set_cache_true()
+        df_cell = mcds.get_cell_df()
+        df_cell.loc[:,'pressure'] = -1
+        df_cache = mcds.get_cell_df()
+        b_cache = (mcds.data['cache']['df_cell'] is not None) and (mcds.data['cache']['df_conc'] is not None)
+        mcds.clear_cache()
+        assert(str(type(mcds)) == "<class 'pcdl.pyMCDS.pyMCDS'>") and \
+              (mcds.cache) and \
+              (b_cache) and \
+              (df_cache.loc[:,'pressure'].min() >= 0) and \
+              (mcds.data['cache']['df_cell'] is None) and \
+              (mcds.data['cache']['df_conc'] is None)
+
+    def test_mcds_set_cache_false(self, mcds=mcds):
+        mcds.set_cache_true()
+        mcds.get_cell_df()
+        mcds.set_cache_false()
+        assert(str(type(mcds)) == "<class 'pcdl.pyMCDS.pyMCDS'>") and \
+              (not mcds.cache) and \
+              (mcds.data['cache']['df_cell'] is None) and \
+              (mcds.data['cache']['df_conc'] is None)
+
+
 ## metadata related functions ##
 
 class TestPyMcdsMetadata(object):
@@ -413,6 +481,32 @@ class TestPyMcdsMesh(object):
               (not mcds.is_in_mesh(x=0, y=201, z=0, halt=False)) and \
               (not mcds.is_in_mesh(x=0, y=0, z=6, halt=False))
 
+    def test_mcds_is_in_mesh_batch(self, mcds=mcds):
+        ab_isinmesh = mcds.is_in_mesh_batch(xyz=[[0,0,0], [301,0,0], [0,201,0], [0,0,6]], halt=False)
+        assert(str(type(mcds)) == "<class 'pcdl.pyMCDS.pyMCDS'>") and \
+              (str(type(ab_isinmesh)) == "<class 'numpy.ndarray'>") and \
+              (str(ab_isinmesh.dtype) == 'bool') and \
+              (list(ab_isinmesh) == [True, False, False, False])
+
+    def test_mcds_get_mesh_mnp(self, mcds=mcds):
+        lr_mnp_0 = mcds.get_mesh_mnp(x=0, y=0, z=0, is_in_mesh=True) # if b_calc
+        lr_mnp_1 = mcds.get_mesh_mnp(x=16, y=11, z=0, is_in_mesh=True) # if b_calc
+        lr_mnp_none = mcds.get_mesh_mnp(x=-31, y=-21, z=-6, is_in_mesh=True) # else b_calc
+        assert(str(type(mcds)) == "<class 'pcdl.pyMCDS.pyMCDS'>") and \
+              (str(type(lr_mnp_0)) == "<class 'list'>") and \
+              (lr_mnp_0 == [-15.0, -10.0, 0.0]) and \
+              (lr_mnp_1 == [15.0, 10.0, 0.0]) and \
+              (lr_mnp_none is None)
+
+    def test_mcds_get_mesh_mnp_batch(self, mcds=mcds):
+        ar_mnp = mcds.get_mesh_mnp_batch(xyz=[[0,0,0], [16,11,0], [-31,-21,-6]], is_in_mesh=True)
+        assert(str(type(mcds)) == "<class 'pcdl.pyMCDS.pyMCDS'>") and \
+              (str(type(ar_mnp)) == "<class 'numpy.ndarray'>") and \
+              (ar_mnp.shape == (3, 3)) and \
+              (list(ar_mnp[0]) == [-15.0, -10.0, 0.0]) and \
+              (list(ar_mnp[1]) == [15.0, 10.0, 0.0]) and \
+              (np.isnan(ar_mnp[2]).all())
+
     def test_mcds_get_voxel_ijk(self, mcds=mcds):
         li_voxel_0 = mcds.get_voxel_ijk(x=0, y=0, z=0, is_in_mesh=True) # if b_calc
         li_voxel_1 = mcds.get_voxel_ijk(x=15, y=10, z=0, is_in_mesh=True) # if b_calc
@@ -426,6 +520,14 @@ class TestPyMcdsMesh(object):
               (li_voxel_2 == [2, 2, 0]) and \
               (li_voxel_none is None)
 
+    def test_mcds_get_voxel_ijk_batch(self, mcds=mcds):
+        ai_ijk, ab_isinmesh = mcds.get_voxel_ijk_batch(x=[0, 15, 30, -31], y=[0, 10, 20, -21], z=[0, 0, 0, -6], is_in_mesh=True)
+        assert(str(type(mcds)) == "<class 'pcdl.pyMCDS.pyMCDS'>") and \
+              (str(type(ai_ijk)) == "<class 'numpy.ndarray'>") and \
+              (ai_ijk.shape == (4, 3)) and \
+              (ai_ijk[:3].tolist() == [[0, 0, 0], [1, 1, 0], [2, 2, 0]]) and \
+              (list(ab_isinmesh) == [True, True, True, False])
+
 
 ## micro environment related functions ##
 
@@ -528,6 +630,14 @@ class TestPyMcdsMicroenv(object):
               (str(type(df_conc)) == "<class 'pandas.core.frame.DataFrame'>") and \
               (df_conc.shape == (121, 10))
 
+    def test_mcds_get_conc_df_dtype(self, mcds=mcds):
+        df_conc = mcds.get_conc_df(z_slice=None, halt=False, values=1, drop=set(), keep=set(), dtype=np.float32)
+        assert(str(type(mcds)) == "<class 'pcdl.pyMCDS.pyMCDS'>") and \
+              (str(type(df_conc)) == "<class 'pandas.core.frame.DataFrame'>") and \
+              (df_conc.shape == (121, 10)) and \
+              (df_conc.loc[:,'oxygen'].dtype == np.float32) and \
+              (df_conc.loc[:,'mesh_center_m'].dtype == np.float64)
+
     def test_mcds_plot_contour(self, mcds=mcds):
         fig = mcds.plot_contour(
             'oxygen',
@@ -615,6 +725,30 @@ class TestPyMcdsCell(object):
               (str(type(df_cell)) == "<class 'pandas.core.frame.DataFrame'>") and \
               (df_cell.shape == (1099, 13))
 
+    def test_mcds_get_cell_df_cache(self, mcds=mcds):
+        df_cell = mcds.get_cell_df(values=1, drop=set(), keep=set())
+        df_cell.drop('oxygen', axis=1, inplace=True)
+        df_cell.loc[:,'pressure'] = -1
+        df_cache = mcds.get_cell_df(values=1, drop=set(), keep=set())
+        assert(str(type(mcds)) == "<class 'pcdl.pyMCDS.pyMCDS'>") and \
+              (str(type(df_cache)) == "<class 'pandas.core.frame.DataFrame'>") and \
+              (df_cache.shape == (1099, 95)) and \
+              (df_cache.loc[:,'pressure'].min() >= 0)
+
+    def test_mcds_get_cell_df_drop_copy(self, mcds=mcds):
+        df_cell = mcds.get_cell_df(values=1, drop={'oxygen'}, keep=set())
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            df_cell['count'] = 1
+        df_cache = mcds.get_cell_df(values=1, drop=set(), keep=set())
+        assert(str(type(mcds)) == "<class 'pcdl.pyMCDS.pyMCDS'>") and \
+              (str(type(df_cell)) == "<class 'pandas.core.frame.DataFrame'>") and \
+              (df_cell.shape == (1099, 95)) and \
+              (df_cache.shape == (1099, 95)) and \
+              (set(df_cache.columns).issuperset({'oxygen'})) and \
+              not (set(df_cache.columns).issuperset({'count'})) and \
+              (list(df_cell.columns[:-1]) == sorted(df_cell.columns[:-1]))
+
     def test_mcds_get_cell_df_at_inmeash(self, mcds=mcds):
         df_cell = mcds.get_cell_df_at(x=0, y=0, z=0, values=1, drop=set(), keep=set())
         assert(str(type(mcds)) == "<class 'pcdl.pyMCDS.pyMCDS'>") and \